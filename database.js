@@ -2576,12 +2576,18 @@ const dbHelpers = {
         status = null,
         limit = 50,
         offset = 0,
-        includeRead = true
+        includeRead = true,
+        sinceId = null
       } = options;
 
       let whereConditions = ['am.to_instance_id = ?'];
       let queryParams = [instanceId];
 
+      if (sinceId) {
+        whereConditions.push('am.id > ?');
+        queryParams.push(sinceId);
+      }
+
       if (messageType) {
         whereConditions.push('am.message_type = ?');
         queryParams.push(messageType);
@@ -645,11 +645,12 @@ class ContentWritingAgent(AgentCore):
             requirements = brief.get("requirements", {})
             
             # Generate blog post content
+            content_text = self.generate_blog_content(brief)
             blog_content = {
                 "title": brief["title"],
                 "meta_description": f"Discover how {product_info['name']} can transform your business with advanced analytics and AI-powered insights.",
-                "content": self.generate_blog_content(brief),
-                "word_count": 1200,
+                "content": content_text,
+                "word_count": content_text.count(' ') + 1,
                 "seo_keywords": ["business analytics", "AI insights", "data visualization", "business intelligence"],
                 "call_to_action": {
                     "text": f"Ready to transform your business with {product_info['name']}? Start your free trial today!",
@@ -691,12 +692,9 @@ class ContentWritingAgent(AgentCore):
             product_info = brief["product_info"]
             
             # Platform-specific content
-            if platform == "linkedin":
-                content = self.create_linkedin_post(brief)
-            elif platform == "twitter":
-                content = self.create_twitter_post(brief)
-            elif platform == "instagram":
-                content = self.create_instagram_post(brief)
+            creator = self._PLATFORM_CREATORS.get(platform)
+            if creator:
+                content = creator(self, brief)
             else:
                 content = self.create_general_social_post(brief)
             
@@ -724,6 +722,7 @@ class ContentWritingAgent(AgentCore):
         
         try:
             product_info = brief["product_info"]
+            content_text = self.generate_email_content(brief)
             
             email_content = {
                 "subject_lines": [
@@ -732,7 +731,7 @@ class ContentWritingAgent(AgentCore):
                     f"New: AI-Powered Analytics Platform for Your Business"
                 ],
                 "preheader": "Discover how AI-powered analytics can revolutionize your decision making",
-                "content": self.generate_email_content(brief),
+                "content": content_text,
                 "call_to_action": {
                     "primary": {
                         "text": "Start Free Trial",
@@ -744,7 +743,7 @@ class ContentWritingAgent(AgentCore):
                     }
                 },
                 "personalization_tags": ["{{first_name}}", "{{company_name}}"],
-                "word_count": 450
+                "word_count": content_text.count(' ') + 1
             }
             
             quality_score = 8.8
@@ -799,6 +798,43 @@ Companies using {product_info['name']} typically see:
 - **20% cost reduction** by identifying inefficiencies quickly
 - **Improved accuracy** in forecasting and planning
 
+## How It Works
+
+Getting started with {product_info['name']} takes an afternoon, not a quarter. The platform connects to the tools your team already relies on – your CRM, your accounting software, your marketing platforms, and your data warehouse – through a library of ready-made connectors. Once your sources are linked, {product_info['name']} automatically cleans, joins, and organizes the data so that every report draws from a single, consistent source of truth.
+
+From there, the AI engine goes to work. It learns the normal rhythm of your business, flags unusual changes as soon as they appear, and surfaces the trends that deserve your attention. Instead of digging through spreadsheets to find out why revenue dipped last Tuesday, you get a clear explanation in plain language, along with the metrics that drove the change.
+
+## Built for the Way Your Team Works
+
+Analytics only creates value when people actually use it. That's why {product_info['name']} is designed for everyone in your organization, not just the data specialists:
+
+- **Executives** get a concise overview of company performance, with forecasts that make planning conversations faster and more grounded
+- **Business analysts** spend less time assembling reports and more time answering the questions that move the business forward
+- **Sales and marketing teams** track pipeline, campaign performance, and customer behavior without waiting on a weekly export
+- **Operations managers** spot bottlenecks early and measure the impact of every process improvement
+
+Dashboards can be shared with a single link, scheduled to arrive in your inbox every morning, or embedded in the tools your team already opens every day. Role-based permissions make sure that everyone sees exactly the data they need, and nothing they shouldn't.
+
+## A Closer Look at Predictive Insights
+
+Forecasting has traditionally required a dedicated data science team and weeks of modeling work. {product_info['name']} brings those capabilities to every user. Choose a metric, choose a time horizon, and the platform builds a forecast that accounts for seasonality, recent trends, and the relationships between your key drivers.
+
+Each forecast comes with a confidence range, so you know how much weight to give it, and the model updates automatically as new data arrives. When reality starts to drift away from the plan, you'll know about it in days rather than at the end of the quarter, which leaves time to adjust budgets, staffing, or inventory before small gaps become expensive problems.
+
+## Security and Reliability You Can Count On
+
+Your data is one of your most valuable assets, and we treat it that way. {product_info['name']} encrypts data in transit and at rest, supports single sign-on, and keeps a detailed audit log of who viewed or changed what. Our infrastructure is monitored around the clock, and automatic backups ensure that your dashboards and reports are always available when you need them.
+
+## What Customers Are Saying
+
+Teams that switch to {product_info['name']} often describe the change in the same way: meetings got shorter, and decisions got better. Instead of debating whose spreadsheet has the right numbers, everyone starts from the same dashboard and spends the time deciding what to do next. Finance leaders tell us that month-end reporting now takes hours instead of days, while marketing teams say they can finally see which campaigns drive revenue, not just clicks.
+
+Perhaps most importantly, customers find that analytics stops being a bottleneck. Questions that used to sit in a queue for the data team can now be answered by the people who ask them, which frees analysts to focus on the deeper, strategic work that only they can do.
+
+## Getting Started Is Easy
+
+Every new account includes a guided onboarding session with one of our analytics specialists. Together, we'll connect your first data sources, build a dashboard around the metrics that matter most to you, and set up the alerts that will keep your team informed. Most customers see their first actionable insight within the first week, and our support team is available whenever questions come up along the way.
+
 ## Ready to Transform Your Analytics?
 
 Don't let outdated analytics hold your business back. Join hundreds of companies already using {product_info['name']} to make smarter, faster decisions.
@@ -809,11 +845,12 @@ Don't let outdated analytics hold your business back. Join hundreds of companies
     def create_linkedin_post(self, brief):
         """Create LinkedIn-specific content"""
         product_info = brief["product_info"]
+        text = f"🚀 Excited to announce the launch of {product_info['name']}!\n\nAfter seeing countless businesses struggle with manual reporting and data silos, we built an AI-powered analytics platform that delivers insights in real-time.\n\nEarly customers are seeing:\n✅ 30% faster decision making\n✅ 20% cost reduction\n✅ Improved forecasting accuracy\n\nWhat's your biggest analytics challenge? Let's discuss in the comments! 👇\n\n#BusinessAnalytics #AI #DataDriven #BusinessIntelligence"
         
         return {
-            "text": f"🚀 Excited to announce the launch of {product_info['name']}!\n\nAfter seeing countless businesses struggle with manual reporting and data silos, we built an AI-powered analytics platform that delivers insights in real-time.\n\nEarly customers are seeing:\n✅ 30% faster decision making\n✅ 20% cost reduction\n✅ Improved forecasting accuracy\n\nWhat's your biggest analytics challenge? Let's discuss in the comments! 👇\n\n#BusinessAnalytics #AI #DataDriven #BusinessIntelligence",
+            "text": text,
             "hashtags": ["#BusinessAnalytics", "#AI", "#DataDriven", "#BusinessIntelligence"],
-            "character_count": 420,
+            "character_count": len(text),
             "call_to_action": "Comment with your analytics challenges",
             "visual_suggestion": "Product dashboard screenshot with key metrics highlighted"
         }
@@ -821,15 +858,22 @@ Don't let outdated analytics hold your business back. Join hundreds of companies
     def create_twitter_post(self, brief):
         """Create Twitter-specific content"""
         product_info = brief["product_info"]
+        text = f"🚀 Introducing {product_info['name']} - AI-powered analytics that actually work!\n\n📊 Real-time dashboards\n🔮 Predictive insights\n⚡ 30% faster decisions\n\nNo more waiting for reports. Get insights instantly.\n\n#Analytics #AI #BusinessData"
         
         return {
-            "text": f"🚀 Introducing {product_info['name']} - AI-powered analytics that actually work!\n\n📊 Real-time dashboards\n🔮 Predictive insights\n⚡ 30% faster decisions\n\nNo more waiting for reports. Get insights instantly.\n\n#Analytics #AI #BusinessData",
+            "text": text,
             "hashtags": ["#Analytics", "#AI", "#BusinessData"],
-            "character_count": 220,
+            "character_count": len(text),
             "thread_potential": True,
             "visual_suggestion": "Animated GIF showing dashboard updates in real-time"
         }
     
+    # Platform -> content creator dispatch table used by create_social_media_post
+    _PLATFORM_CREATORS = {
+        "linkedin": create_linkedin_post,
+        "twitter": create_twitter_post
+    }
+    
     def generate_email_content(self, brief):
         """Generate email newsletter content"""
         product_info = brief["product_info"]
@@ -851,7 +895,19 @@ We're thrilled to introduce {product_info['name']} – the analytics platform th
 
 **Want to see it in action?**
 
-We'd love to show you exactly how {product_info['name']} can transform your analytics. 
+We'd love to show you exactly how {product_info['name']} can transform your analytics. In a short, personalized demo, one of our specialists will connect a sample of your own data and walk you through the dashboards, forecasts, and alerts that matter most to your team. You'll leave the session with a clear picture of where your biggest opportunities are, whether or not you decide to move forward.
+
+**Here's what our customers tell us they value most:**
+
+- Getting a single, trusted view of performance instead of reconciling numbers from five different systems
+- Spending Monday mornings acting on insights rather than building the reports that contain them
+- Catching problems early, while there is still time to do something about them
+
+Setting up takes less time than you might expect. Our team handles the initial connections for you, and most customers are sharing their first live dashboard within a few days. Every plan includes onboarding support, a library of ready-made report templates, and access to our analytics specialists whenever you need a hand.
+
+If you've been meaning to modernize the way your team works with data, there has never been a better time to start. Reply to this email or click the button below to book your demo, and we'll take care of the rest.
+
+P.S. Demo slots for this month are filling up quickly. If your team is planning next quarter's budget, now is the perfect moment to see how real-time insights and reliable forecasts can make those conversations faster, clearer, and far more confident.
 
 Best regards,
 The {product_info['name']} Team
@@ -866,7 +922,10 @@ The {product_info['name']} Team
         if "call_to_action" in content:
             score += 0.5
         
-        word_count = content.get("word_count", 0)
+        word_count = content.get("word_count")
+        if word_count is None:
+            text = content.get("content") or content.get("text") or ""
+            word_count = text.count(' ') + 1 if text else 0
         target_range = brief.get("requirements", {}).get("word_count", {})
         if target_range.get("min", 0) <= word_count <= target_range.get("max", 10000):
             score += 0.5
@@ -3,6 +3,7 @@ const cors = require('cors');
 const path = require('path');
 const fs = require('fs');
 const multer = require('multer');
+const { EventEmitter } = require('events');
 const { db, dbHelpers, testConnection, initializeDatabase } = require('./database');
 const CodeScanner = require('./utils/codeScanner');
 
@@ -1764,6 +1765,32 @@ app.get('/api/instances/stale', async (req, res) => {
 // INTER-AGENT MESSAGING API ENDPOINTS
 // ============================================================================
 
+// In-process notifications of new messages, emitted as `message:<instance_id>`
+// with the message id. Used to push messages to connected agent streams.
+const messageEvents = new EventEmitter();
+messageEvents.setMaxListeners(0);
+
+const MAX_MESSAGE_WAIT_SECONDS = 30;
+
+// Resolves true when a message for the instance is sent, false on timeout or client disconnect
+function waitForMessage(instanceId, timeoutMs, res) {
+  return new Promise((resolve) => {
+    const eventName = `message:${instanceId}`;
+    const finish = (arrived) => {
+      clearTimeout(timer);
+      messageEvents.off(eventName, onMessage);
+      res.off('close', onClose);
+      resolve(arrived);
+    };
+    const onMessage = () => finish(true);
+    const onClose = () => finish(false);
+    const timer = setTimeout(() => finish(false), timeoutMs);
+
+    messageEvents.on(eventName, onMessage);
+    res.on('close', onClose);
+  });
+}
+
 // POST /api/agents/message - Send message from one agent to another
 app.post('/api/agents/message', 
   validateApiKey, 
@@ -1885,6 +1912,9 @@ app.post('/api/agents/message',
     // Update delivery status to delivered (since we're using HTTP for now)
     await dbHelpers.updateMessageStatus(messageResult.message_id, 'delivered');
 
+    // Push to the recipient if it has an open message stream
+    messageEvents.emit(`message:${toInstanceId}`, messageResult.message_id);
+
     res.status(201).json({
       message: 'Message sent successfully',
       messageId: messageResult.message_id,
@@ -1930,7 +1960,9 @@ app.get('/api/agents/:instance_id/messages',
       status, 
       limit = 50, 
       offset = 0, 
-      include_read = 'true' 
+      include_read = 'true',
+      since,
+      wait
     } = req.query;
 
     // Validate instance_id
@@ -1960,14 +1992,26 @@ app.get('/api/agents/:instance_id/messages',
     }
 
     // Get messages with filtering options
-    const messages = await dbHelpers.getMessages(instanceId, {
+    const fetchMessages = () => dbHelpers.getMessages(instanceId, {
       messageType: message_type,
       status,
       limit: parseInt(limit),
       offset: parseInt(offset),
-      includeRead: include_read === 'true'
+      includeRead: include_read === 'true',
+      sinceId: parseInt(since) || null
     });
 
+    let messages = await fetchMessages();
+
+    // Long-poll: with ?wait=N, hold an empty response until a message arrives or N seconds pass
+    const waitSeconds = Math.min(parseInt(wait) || 0, MAX_MESSAGE_WAIT_SECONDS);
+    if (messages.length === 0 && waitSeconds > 0) {
+      const arrived = await waitForMessage(instanceId, waitSeconds * 1000, res);
+      if (arrived) {
+        messages = await fetchMessages();
+      }
+    }
+
     res.json({
       message: `Found ${messages.length} message(s) for instance: ${instance.instance_name}`,
       instance: {
@@ -2017,6 +2061,94 @@ app.get('/api/agents/:instance_id/messages',
   }
 });
 
+// GET /api/agents/:instance_id/stream - Server-Sent Events stream of new messages for an agent instance
+app.get('/api/agents/:instance_id/stream', validateApiKey, async (req, res) => {
+  try {
+    const { instance_id } = req.params;
+
+    // Validate instance_id
+    const instanceId = parseInt(instance_id);
+    if (isNaN(instanceId) || instanceId <= 0) {
+      return res.status(400).json({
+        error: 'Invalid instance_id',
+        message: 'instance_id must be a positive number'
+      });
+    }
+
+    // Only allow agents to stream their own messages
+    if (req.agentAuth.instanceId !== instanceId) {
+      return res.status(403).json({
+        error: 'Unauthorized',
+        message: 'You can only stream messages for your own instance'
+      });
+    }
+
+    res.set({
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache',
+      'Connection': 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    });
+    res.flushHeaders();
+    res.write(': connected\n\n');
+
+    const eventName = `message:${instanceId}`;
+    const onMessage = async (messageId) => {
+      try {
+        const msg = await dbHelpers.getMessageById(messageId);
+        if (!msg) {
+          return;
+        }
+
+        const payload = {
+          id: msg.id,
+          from: {
+            instance_id: msg.from_instance_id,
+            instance_name: msg.from_instance_name
+          },
+          to: {
+            instance_id: msg.to_instance_id,
+            instance_name: msg.to_instance_name
+          },
+          type: msg.message_type,
+          subject: msg.subject,
+          content: msg.content,
+          priority: msg.priority,
+          correlation_id: msg.correlation_id,
+          status: msg.status,
+          expires_at: msg.expires_at,
+          created_at: msg.created_at,
+          delivered_at: msg.delivered_at,
+          read_at: msg.read_at
+        };
+
+        res.write(`id: ${msg.id}\ndata: ${JSON.stringify(payload)}\n\n`);
+      } catch (error) {
+        console.error('Error streaming message:', error);
+      }
+    };
+
+    messageEvents.on(eventName, onMessage);
+
+    // Comment lines keep proxies from closing an idle stream
+    const heartbeat = setInterval(() => res.write(': ping\n\n'), 25000);
+
+    res.on('close', () => {
+      clearInterval(heartbeat);
+      messageEvents.off(eventName, onMessage);
+    });
+
+  } catch (error) {
+    console.error('Error opening message stream:', error);
+    if (!res.headersSent) {
+      res.status(500).json({
+        error: 'Failed to open message stream',
+        message: error.message
+      });
+    }
+  }
+});
+
 // PUT /api/messages/:message_id/status - Update message status (mark as read, etc.)
 app.put('/api/messages/:message_id/status', validateApiKey, async (req, res) => {
   try {
@@ -22,17 +22,79 @@ Then interact normally - the agent decides when to collaborate!
 
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import os
 import json
+import logging
+import logging.handlers
 import asyncio
+import hashlib
+import heapq
+import random
+import queue
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from dotenv import load_dotenv
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple, Callable
 import re
+import secrets
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module works the same, just slower
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# JSON helpers: orjson when installed, stdlib json otherwise
+if orjson is not None:
+    def dumps_json(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    loads_json = orjson.loads
+else:
+    def dumps_json(data) -> str:
+        # Match orjson's compact, unescaped output to keep message content small
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+    loads_json = json.loads
+
+# Message prefixes used by specialist agents when replying to a collaboration request
+COLLABORATION_RESPONSE_TYPES = frozenset({
+    'validation_response',
+    'technical_response',
+    'image_response',
+    'help_response',
+    'validation_error',
+    'technical_error',
+    'image_error',
+    'help_error'
+})
+
+# Precompiled patterns for parsing Ollama responses
+DECISION_RE = re.compile(r'DECISION:\s*(\w+)')
+CONFIDENCE_RE = re.compile(r'CONFIDENCE:\s*(\d+)')
+REASONING_RE = re.compile(r'REASONING:\s*(.*?)(?:\n|$)', re.DOTALL)
+REASONING_LINE_RE = re.compile(r'REASONING:[^\n]*\S[^\n]*\n')
+CATEGORY_RE = re.compile(r'category:?\s*([a-zA-Z\-]+)', re.IGNORECASE)
+FEASIBILITY_RE = re.compile(r'feasibility:?\s*(\d+)', re.IGNORECASE)
+LIST_PREFIX_RE = re.compile(r'^[\d\.\-\*\s]*')
+TITLE_MARKUP_RE = re.compile(r'[\*\:\-]')
+TITLE_MARKERS = ('title:', 'idea:', '**', 'solution:')
+MAX_PARSED_IDEAS = 8
+
+# Instance name patterns used to match discovered agents to a help type
+AGENT_NAME_PATTERNS = {
+    "validator": ["validator", "fact", "check", "verify"],
+    "technical": ["technical", "tech", "engineer", "architect", "developer"],
+    "image_generator": ["image", "visual", "generate", "picture", "diagram"]
+}
+
 
 class RealtimeIdeaAgent:
     """
@@ -46,22 +108,69 @@ class RealtimeIdeaAgent:
         self.api_key: Optional[str] = None
         self.instance_id: Optional[int] = None
 
+        # Shared keep-alive connection pool for platform and Ollama calls
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._auth_headers: Dict[str, str] = {}
+
+        # Workers for running independent Ollama calls concurrently
+        self._ollama_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ollama")
+        # Workers for requests from other agents. Kept apart from the Ollama pool,
+        # whose tasks these handlers wait on.
+        self._request_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-request")
+        self._request_futures: "Set[Future]" = set()  # Submitted and not yet finished
+        self._request_futures_lock = threading.Lock()
+        self.stop_drain_timeout = 10  # Seconds stop() waits for in-flight requests
+
         # AI Model configuration
         self.model = os.getenv("OLLAMA_MODEL", "phi3:mini")
 
+        # Concurrent requests the Ollama server accepts (its OLLAMA_NUM_PARALLEL).
+        # Above 1, ideas are generated one per request in parallel.
+        self.ollama_parallel = int(os.getenv("OLLAMA_NUM_PARALLEL", "1"))
+        self._idea_pool: Optional[ThreadPoolExecutor] = None
+        if self.ollama_parallel > 1:
+            self._idea_pool = ThreadPoolExecutor(max_workers=self.ollama_parallel, thread_name_prefix="ollama-idea")
+
         # Platform communication
         self.running = False
-        self.health_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Wakes sleeping background loops on stop()
+        self.scheduler_thread: Optional[threading.Thread] = None
         self.message_thread: Optional[threading.Thread] = None
-        self.processed_messages = set()
+        self.sender_thread: Optional[threading.Thread] = None
+        # Responses to other agents, posted in order by the sender thread
+        self._outbox: "queue.Queue[Optional[Dict]]" = queue.Queue()
+        # Recently seen message ids, oldest first, capped so long runs don't leak memory
+        self.processed_messages: "OrderedDict[int, None]" = OrderedDict()
+        self.processed_messages_limit = 10000
+
+        # Outstanding collaboration requests, keyed by request_id. Each entry holds
+        # an Event that the message processing loop sets when the response arrives.
+        self._pending_collaborations: Dict[str, Dict] = {}
+        self._pending_lock = threading.Lock()
 
         # Configuration
         self.health_interval = 30
-        self.message_check_interval = 3
+        # Message polling backs off from the min interval while idle, resetting on activity
+        self.message_poll_min_interval = float(os.getenv("MESSAGE_POLL_MIN_INTERVAL", "0.5"))
+        self.message_poll_max_interval = float(os.getenv("MESSAGE_POLL_MAX_INTERVAL", "10"))
+        self._idle_polls = 0
+        self.message_stream_supported = True  # Cleared if the platform has no stream endpoint
+        self.message_long_poll_wait = 25  # Seconds the platform may hold an empty poll open
+        self._last_message_id = 0  # Highest message id seen, sent as ?since= when polling
+        self._messages_etag: Optional[str] = None  # Lets unchanged polls come back as 304
 
         # Available agents cache (updated dynamically)
         self.available_agents = {}
+        self._agents_by_type: Dict[str, List[Dict]] = {}
         self.agent_discovery_interval = 60  # Refresh every minute
+        self.max_backoff_interval = 300  # Cap for retries after repeated failures
+
+        # Last GET response per url: url -> {"etag", "body_hash", "body"}
+        self._http_cache: Dict[str, Dict] = {}
 
         # Statistics
         self.user_requests_handled = 0
@@ -72,7 +181,8 @@ class RealtimeIdeaAgent:
         self.collaboration_patterns = {
             "validation_needed": [
                 "financial", "investment", "money", "profit", "trading", "stock",
-                "business strategy", "market analysis", "go-to-market",
+                "business strategy", "market analysis", "go-to-market", "fintech",
+                "startup", "business", "strategy", "market",
                 "medical", "health", "treatment", "drug", "safety", "legal"
             ],
             "technical_help": [
@@ -89,46 +199,65 @@ class RealtimeIdeaAgent:
             ]
         }
 
-        print(f"🚀 {self.agent_name} initializing...")
-        print("🧠 Intelligence: Will decide when to collaborate with other agents")
-        print("💬 Communication: Real-time platform integration")
+        # Recent AI collaboration decisions keyed by normalized request hash -> (expiry, decision)
+        self._analysis_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+        self.analysis_cache_size = 512
+        self.analysis_cache_ttl = 600
+
+        # Single alternation over every keyword (longest first), wrapped in a lookahead
+        # so one scan reports the longest keyword at every position, overlapping ones
+        # included. Shorter keywords starting at the same position are its prefixes.
+        all_keywords = {keyword for keywords in self.collaboration_patterns.values() for keyword in keywords}
+        self._keyword_prefixes: Dict[str, List[str]] = {
+            keyword: [other for other in all_keywords if keyword.startswith(other)]
+            for keyword in all_keywords
+        }
+        alternation = '|'.join(re.escape(keyword) for keyword in sorted(all_keywords, key=len, reverse=True))
+        self._keyword_re = re.compile(f'(?=({alternation}))')
+
+        logger.info("🚀 %s initializing...", self.agent_name)
+        logger.info("🧠 Intelligence: Will decide when to collaborate with other agents")
+        logger.info("💬 Communication: Real-time platform integration")
 
     def start_agent_service(self):
         """Start the agent as a standalone service"""
-        print("🔗 Connecting to Emergence Platform...")
+        logger.info("🔗 Connecting to Emergence Platform...")
 
         if not self.register_with_platform():
-            print("❌ Failed to register with platform")
+            logger.error("❌ Failed to register with platform")
             return False
 
         self.running = True
+        self._stop_event.clear()
 
         # Start background services
-        self.health_thread = threading.Thread(target=self._health_monitoring_loop, daemon=True)
-        self.health_thread.start()
+        # Agent discovery and health pings share one scheduler thread; message
+        # polling keeps its own thread so slow polls don't delay the timers
+        self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self.scheduler_thread.start()
 
         self.message_thread = threading.Thread(target=self._message_processing_loop, daemon=True)
         self.message_thread.start()
 
-        # Start agent discovery
-        self.discovery_thread = threading.Thread(target=self._agent_discovery_loop, daemon=True)
-        self.discovery_thread.start()
+        self.sender_thread = threading.Thread(target=self._response_sender_loop, daemon=True)
+        self.sender_thread.start()
 
-        print("✅ Agent service started!")
-        print("🤖 Ready to help users with intelligent collaboration")
+        logger.info("✅ Agent service started!")
+        logger.info("🤖 Ready to help users with intelligent collaboration")
         return True
 
     def register_with_platform(self) -> bool:
         """Register with the Emergence platform"""
         try:
-            response = requests.get(f"{self.platform_url}/api/agents", timeout=10)
-            if response.status_code != 200:
-                print(f"❌ Failed to get agents: {response.status_code}")
+            body, _ = self._cached_get(f"{self.platform_url}/api/agents", timeout=10)
+            if body is None:
+                logger.error("❌ Failed to get agents")
                 return False
 
-            agents = response.json().get('agents', [])
+            agents = body.get('agents', [])
             if not agents:
-                print("❌ No agents available for registration")
+                logger.error("❌ No agents available for registration")
                 return False
 
             registration_data = {
@@ -137,55 +266,59 @@ class RealtimeIdeaAgent:
                 "status": "running"
             }
 
-            response = requests.post(
+            response = self._http.post(
                 f"{self.platform_url}/api/webhook/register",
                 json=registration_data,
                 timeout=10
             )
 
             if response.status_code in [200, 201]:
-                result = response.json()
+                result = loads_json(response.content)
                 self.instance_id = result['instance']['id']
                 self.api_key = result['security']['api_key']
-                print(f"✅ Registered as instance {self.instance_id}")
+                self._auth_headers = {"X-API-Key": self.api_key}
+                logger.info("✅ Registered as instance %s", self.instance_id)
                 return True
             else:
-                print(f"❌ Registration failed: {response.text}")
+                logger.error("❌ Registration failed: %s", response.text)
                 return False
 
         except Exception as e:
-            print(f"❌ Registration error: {e}")
+            logger.error("❌ Registration error: %s", e)
             return False
 
     def generate_ideas_with_intelligent_collaboration(self, user_request: str) -> Dict:
         """
         Main function: Generate ideas and intelligently decide on collaboration
         """
-        print(f"\n💭 User Request: {user_request}")
-        print("🧠 Analyzing if I should work independently or collaborate...")
+        logger.info("\n💭 User Request: %s", user_request)
+        logger.info("🧠 Analyzing if I should work independently or collaborate...")
 
         start_time = time.time()
 
         try:
-            # Step 1: AI-powered collaboration analysis
-            collaboration_decision = self.analyze_collaboration_need(user_request)
+            # Steps 1 and 2 are independent Ollama calls, so run them concurrently:
+            # AI-powered collaboration analysis and initial idea generation
+            decision_future = self._ollama_pool.submit(self.analyze_collaboration_need, user_request)
+            logger.info("💡 Generating ideas...")
+            ideas_future = self._ollama_pool.submit(self.generate_initial_ideas, user_request)
+
+            collaboration_decision = decision_future.result()
 
-            print(f"🤖 AI Decision: {collaboration_decision['action']}")
-            print(f"💭 Reasoning: {collaboration_decision['reasoning']}")
+            logger.info("🤖 AI Decision: %s", collaboration_decision['action'])
+            logger.info("💭 Reasoning: %s", collaboration_decision['reasoning'])
 
-            # Step 2: Generate initial ideas
-            print("💡 Generating ideas...")
-            initial_ideas = self.generate_initial_ideas(user_request)
+            initial_ideas = ideas_future.result()
 
             # Step 3: Decide on collaboration based on analysis
             if collaboration_decision['collaborate']:
-                print(f"🤝 Seeking help from {collaboration_decision['help_type']} specialist...")
+                logger.info("🤝 Seeking help from %s specialist...", collaboration_decision['help_type'])
 
                 # Find appropriate agent
                 target_agent = self.find_suitable_agent(collaboration_decision['help_type'])
 
                 if target_agent:
-                    print(f"🎯 Found {target_agent['type']} agent: {target_agent['name']}")
+                    logger.info("🎯 Found %s agent: %s", target_agent['type'], target_agent['name'])
 
                     # Collaborate with the agent
                     collaboration_result = self.collaborate_with_agent(
@@ -196,18 +329,18 @@ class RealtimeIdeaAgent:
                     )
 
                     if collaboration_result:
-                        print("✅ Collaboration successful!")
+                        logger.info("✅ Collaboration successful!")
                         return self.synthesize_collaborative_result(
                             user_request, initial_ideas, collaboration_result,
                             collaboration_decision, time.time() - start_time
                         )
                     else:
-                        print("⚠️ Collaboration failed, proceeding independently")
+                        logger.warning("⚠️ Collaboration failed, proceeding independently")
                 else:
-                    print(f"⚠️ No {collaboration_decision['help_type']} agent available, proceeding independently")
+                    logger.warning("⚠️ No %s agent available, proceeding independently", collaboration_decision['help_type'])
 
             # Working independently
-            print("🎯 Working independently")
+            logger.info("🎯 Working independently")
             self.independent_responses += 1
 
             return self.create_independent_result(
@@ -216,7 +349,7 @@ class RealtimeIdeaAgent:
             )
 
         except Exception as e:
-            print(f"❌ Error in idea generation: {e}")
+            logger.error("❌ Error in idea generation: %s", e)
             return {
                 "error": f"Idea generation failed: {str(e)}",
                 "user_request": user_request,
@@ -227,8 +360,28 @@ class RealtimeIdeaAgent:
         """
         AI-powered analysis of whether collaboration is needed
         """
+        # Lowercase once; reused for the cache key and any keyword fallback
+        request_lower = user_request.lower()
+        request_key = hashlib.blake2b(request_lower.strip().encode(), digest_size=16).hexdigest()
+
+        now = time.monotonic()
+        cached_decision = None
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(request_key)
+            if cached is not None:
+                expires_at, decision = cached
+                if expires_at > now:
+                    cached_decision = decision
+                    self._analysis_cache.move_to_end(request_key)
+                else:
+                    del self._analysis_cache[request_key]
+
+        if cached_decision is not None:
+            logger.info("🤖 Reusing AI analysis for an identical request")
+            return dict(cached_decision)
+
         try:
-            print("🤖 Attempting AI-powered analysis...")
+            logger.info("🤖 Attempting AI-powered analysis...")
 
             # Create AI prompt for collaboration analysis
             analysis_prompt = f"""I am an AI IdeaAgent analyzing whether I need help from other agents.
@@ -269,25 +422,36 @@ CONFIDENCE: [1-10]
 REASONING: [Why this decision makes sense]
 PRIORITY: [How urgent is collaboration - LOW/MEDIUM/HIGH]"""
 
-            ai_response = self.call_ollama(analysis_prompt)
-            print(f"🤖 AI Response: {ai_response[:200]}...")
+            # Only the decision fields are needed, so stop generating once they're in
+            ai_response = self.call_ollama_streaming(analysis_prompt, self._has_collaboration_decision)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🤖 AI Response: %s...", ai_response[:200])
 
             # Parse AI decision
-            decision = self.parse_collaboration_decision(ai_response, user_request)
+            decision = self.parse_collaboration_decision(ai_response, user_request, request_lower)
+
+            # Only cache real model decisions, not error text or fallbacks
+            if DECISION_RE.search(ai_response):
+                with self._analysis_cache_lock:
+                    self._analysis_cache[request_key] = (time.monotonic() + self.analysis_cache_ttl, decision)
+                    self._analysis_cache.move_to_end(request_key)
+                    if len(self._analysis_cache) > self.analysis_cache_size:
+                        self._analysis_cache.popitem(last=False)
 
-            return decision
+            return dict(decision)
 
         except Exception as e:
-            print(f"⚠️ AI analysis failed: {e}")
+            logger.warning("⚠️ AI analysis failed: %s", e)
             # Fallback decision making
-            return self.fallback_collaboration_analysis(user_request)
+            return self.fallback_collaboration_analysis(user_request, request_lower)
 
-    def parse_collaboration_decision(self, ai_response: str, user_request: str) -> Dict:
+    def parse_collaboration_decision(self, ai_response: str, user_request: str,
+                                     request_lower: Optional[str] = None) -> Dict:
         """Parse AI response into structured collaboration decision"""
         try:
-            decision_match = re.search(r'DECISION:\s*(\w+)', ai_response)
-            confidence_match = re.search(r'CONFIDENCE:\s*(\d+)', ai_response)
-            reasoning_match = re.search(r'REASONING:\s*(.*?)(?:\n|$)', ai_response, re.DOTALL)
+            decision_match = DECISION_RE.search(ai_response)
+            confidence_match = CONFIDENCE_RE.search(ai_response)
+            reasoning_match = REASONING_RE.search(ai_response)
 
             decision_type = decision_match.group(1) if decision_match else "INDEPENDENT"
             confidence = int(confidence_match.group(1)) if confidence_match else 5
@@ -327,28 +491,24 @@ PRIORITY: [How urgent is collaboration - LOW/MEDIUM/HIGH]"""
                     "confidence": confidence
                 }
             else:
-                return self.fallback_collaboration_analysis(user_request)
+                return self.fallback_collaboration_analysis(user_request, request_lower)
 
         except Exception as e:
-            return self.fallback_collaboration_analysis(user_request)
+            return self.fallback_collaboration_analysis(user_request, request_lower)
 
-    def fallback_collaboration_analysis(self, user_request: str) -> Dict:
+    def fallback_collaboration_analysis(self, user_request: str, request_lower: Optional[str] = None) -> Dict:
         """Fallback collaboration analysis using keyword matching"""
-        request_lower = user_request.lower()
+        if request_lower is None:
+            request_lower = user_request.lower()
 
-        print(f"🔍 Fallback analysis for: '{request_lower}'")
+        logger.debug("🔍 Fallback analysis for: '%s'", request_lower)
 
-        # Check for validation needs - add more patterns
-        validation_keywords = [
-            "financial", "investment", "money", "profit", "trading", "stock",
-            "business strategy", "market analysis", "go-to-market", "fintech",
-            "startup", "business", "strategy", "market",
-            "medical", "health", "treatment", "drug", "safety", "legal"
-        ]
+        matches = self.match_collaboration_keywords(request_lower)
 
-        validation_matches = [keyword for keyword in validation_keywords if keyword in request_lower]
+        # Check for validation needs
+        validation_matches = matches.get("validation_needed")
         if validation_matches:
-            print(f"✅ Found validation keywords: {validation_matches}")
+            logger.info("✅ Found validation keywords: %s", validation_matches)
             return {
                 "collaborate": True,
                 "action": "SEEK VALIDATION",
@@ -358,7 +518,7 @@ PRIORITY: [How urgent is collaboration - LOW/MEDIUM/HIGH]"""
             }
 
         # Check for technical help needs
-        elif any(keyword in request_lower for keyword in self.collaboration_patterns["technical_help"]):
+        elif "technical_help" in matches:
             return {
                 "collaborate": True,
                 "action": "GET TECHNICAL HELP",
@@ -368,7 +528,7 @@ PRIORITY: [How urgent is collaboration - LOW/MEDIUM/HIGH]"""
             }
 
         # Check for image generation needs
-        elif any(keyword in request_lower for keyword in self.collaboration_patterns["image_generation"]):
+        elif "image_generation" in matches:
             return {
                 "collaborate": True,
                 "action": "REQUEST IMAGE GENERATION",
@@ -387,8 +547,28 @@ PRIORITY: [How urgent is collaboration - LOW/MEDIUM/HIGH]"""
                 "confidence": 6
             }
 
+    def match_collaboration_keywords(self, request_lower: str) -> Dict[str, List[str]]:
+        """
+        Scan the request once and group matched keywords by collaboration category,
+        in the same order as collaboration_patterns lists them
+        """
+        found = set()
+        for match in self._keyword_re.finditer(request_lower):
+            found.update(self._keyword_prefixes[match.group(1)])
+
+        matches: Dict[str, List[str]] = {}
+        if found:
+            for category, keywords in self.collaboration_patterns.items():
+                category_matches = [keyword for keyword in keywords if keyword in found]
+                if category_matches:
+                    matches[category] = category_matches
+        return matches
+
     def generate_initial_ideas(self, user_request: str, num_ideas: int = 5) -> List[Dict]:
         """Generate initial ideas before collaboration"""
+        if self._idea_pool is not None:
+            return self.generate_ideas_in_parallel(user_request, num_ideas)
+
         try:
             prompt = f"""Generate {num_ideas} creative, actionable ideas for this request:
 
@@ -408,7 +588,7 @@ Generate {num_ideas} ideas:"""
             return self.parse_ideas_from_response(response)
 
         except Exception as e:
-            print(f"❌ Error generating initial ideas: {e}")
+            logger.error("❌ Error generating initial ideas: %s", e)
             return [{
                 "title": "Error in idea generation",
                 "description": f"Failed to generate ideas: {str(e)}",
@@ -416,77 +596,115 @@ Generate {num_ideas} ideas:"""
                 "feasibility": 1
             }]
 
-    def find_suitable_agent(self, help_type: str) -> Optional[Dict]:
-        """Find a suitable agent on the platform for the needed help type"""
+    def generate_ideas_in_parallel(self, user_request: str, num_ideas: int = 5) -> List[Dict]:
+        """Generate ideas with one short Ollama request per idea, run concurrently"""
         try:
-            # Map help types to agent name patterns
-            agent_patterns = {
-                "validator": ["validator", "fact", "check", "verify"],
-                "technical": ["technical", "tech", "engineer", "architect", "developer"],
-                "image_generator": ["image", "visual", "generate", "picture", "diagram"]
-            }
+            prompts = [
+                f"""Generate one creative, actionable idea for this request (idea {i} of {num_ideas}, take a different angle from the obvious one):
+
+REQUEST: {user_request}
+
+Provide:
+- TITLE: Clear, specific name
+- DESCRIPTION: Detailed explanation with practical steps
+- CATEGORY: Type of solution (business/technical/creative/etc.)
+- FEASIBILITY: Implementation difficulty (1-10)"""
+                for i in range(1, num_ideas + 1)
+            ]
 
-            patterns = agent_patterns.get(help_type, [])
+            responses = self._idea_pool.map(lambda prompt: self.call_ollama(prompt, num_predict=150), prompts)
 
-            # Search through available agents
-            for agent_info in self.available_agents.values():
-                agent_name = agent_info.get('instance_name', '').lower()
+            ideas = []
+            for response in responses:
+                parsed = self.parse_ideas_from_response(response)
+                if parsed:
+                    ideas.append(parsed[0])
+            return ideas
 
-                # Check if agent name matches the help type
-                if any(pattern in agent_name for pattern in patterns):
-                    return {
-                        "id": agent_info.get('id'),
-                        "name": agent_info.get('instance_name'),
-                        "type": help_type,
-                        "status": agent_info.get('status')
-                    }
+        except Exception as e:
+            logger.error("❌ Error generating initial ideas: %s", e)
+            return [{
+                "title": "Error in idea generation",
+                "description": f"Failed to generate ideas: {str(e)}",
+                "category": "error",
+                "feasibility": 1
+            }]
 
-            print(f"⚠️ No {help_type} agent found in available agents: {list(self.available_agents.keys())}")
+    def find_suitable_agent(self, help_type: str) -> Optional[Dict]:
+        """Find a suitable agent on the platform for the needed help type"""
+        try:
+            # Agents are bucketed by help type whenever discovery refreshes
+            candidates = self._agents_by_type.get(help_type)
+
+            if candidates:
+                agent_info = candidates[0]
+                return {
+                    "id": agent_info.get('id'),
+                    "name": agent_info.get('instance_name'),
+                    "type": help_type,
+                    "status": agent_info.get('status')
+                }
+
+            logger.warning("⚠️ No %s agent found in available agents: %s", help_type, list(self.available_agents.keys()))
             return None
 
         except Exception as e:
-            print(f"❌ Error finding suitable agent: {e}")
+            logger.error("❌ Error finding suitable agent: %s", e)
             return None
 
+    def _index_agents_by_type(self, agents: Dict) -> Dict[str, List[Dict]]:
+        """Group agents by the help types their instance names match"""
+        agents_by_type = {help_type: [] for help_type in AGENT_NAME_PATTERNS}
+
+        for agent_info in agents.values():
+            agent_name = agent_info.get('instance_name', '').lower()
+
+            for help_type, patterns in AGENT_NAME_PATTERNS.items():
+                if any(pattern in agent_name for pattern in patterns):
+                    agents_by_type[help_type].append(agent_info)
+
+        return agents_by_type
+
     def collaborate_with_agent(self, target_agent: Dict, user_request: str, initial_ideas: List[Dict], help_type: str) -> Optional[Dict]:
         """Collaborate with another agent in real-time"""
+        request_id = None
         try:
-            print(f"📤 Sending collaboration request to {target_agent['name']}")
+            logger.info("📤 Sending collaboration request to %s", target_agent['name'])
 
             # Create collaboration request based on help type
             if help_type == "validator":
-                request_id = f'collab_{int(time.time())}_{self.instance_id}'
+                request_id = f"collab_{secrets.token_hex(8)}"
                 request_data = {
                     'ideas': initial_ideas,
                     'problem': user_request,
                     'request_id': request_id
                 }
-                request_content = f"validate_ideas:{json.dumps(request_data)}"
+                request_content = f"validate_ideas:{dumps_json(request_data)}"
             elif help_type == "technical":
-                request_id = f'tech_{int(time.time())}_{self.instance_id}'
+                request_id = f"tech_{secrets.token_hex(8)}"
                 request_data = {
                     'ideas': initial_ideas,
                     'requirements': user_request,
                     'request_id': request_id
                 }
-                request_content = f"technical_review:{json.dumps(request_data)}"
+                request_content = f"technical_review:{dumps_json(request_data)}"
             elif help_type == "image_generator":
-                request_id = f'img_{int(time.time())}_{self.instance_id}'
+                request_id = f"img_{secrets.token_hex(8)}"
                 request_data = {
                     'ideas': initial_ideas,
                     'description': user_request,
                     'request_id': request_id
                 }
-                request_content = f"generate_images:{json.dumps(request_data)}"
+                request_content = f"generate_images:{dumps_json(request_data)}"
             else:
-                request_id = f'help_{int(time.time())}_{self.instance_id}'
+                request_id = f"help_{secrets.token_hex(8)}"
                 request_data = {
                     'ideas': initial_ideas,
                     'request': user_request,
                     'help_type': help_type,
                     'request_id': request_id
                 }
-                request_content = f"help_request:{json.dumps(request_data)}"
+                request_content = f"help_request:{dumps_json(request_data)}"
 
             # Send message to target agent
             message_data = {
@@ -502,96 +720,93 @@ Generate {num_ideas} ideas:"""
                 }
             }
 
-            print(f"📤 Sending to instance {target_agent['id']} from instance {self.instance_id}")
+            logger.info("📤 Sending to instance %s from instance %s", target_agent['id'], self.instance_id)
+
+            # Register the waiter before sending so a fast reply can't be missed. Checked
+            # under the lock stop() releases waiters with, so none is added after it runs.
+            with self._pending_lock:
+                if not self.running:
+                    logger.info("🛑 Agent is stopping, not starting a collaboration")
+                    return None
+                self._pending_collaborations[request_id] = {"event": threading.Event(), "result": None}
 
-            response = requests.post(
+            response = self._http.post(
                 f"{self.platform_url}/api/agents/message",
-                headers={"X-API-Key": self.api_key},
+                headers=self._auth_headers,
                 json=message_data,
                 timeout=10
             )
 
             if response.status_code in [200, 201]:
-                print(f"✅ Collaboration request sent successfully")
+                logger.info("✅ Collaboration request sent successfully")
 
                 # Wait for response with timeout
-                collaboration_result = self.wait_for_collaboration_response(
-                    message_data['content'].split(':')[0],  # Extract request type
-                    timeout=45
-                )
+                collaboration_result = self.wait_for_collaboration_response(request_id, timeout=45)
 
                 self.collaboration_requests_made += 1
                 return collaboration_result
             else:
-                print(f"❌ Failed to send collaboration request: {response.status_code}")
+                logger.error("❌ Failed to send collaboration request: %s", response.status_code)
+                with self._pending_lock:
+                    self._pending_collaborations.pop(request_id, None)
                 return None
 
         except Exception as e:
-            print(f"❌ Collaboration error: {e}")
+            logger.error("❌ Collaboration error: %s", e)
+            with self._pending_lock:
+                self._pending_collaborations.pop(request_id, None)
             return None
 
-    def wait_for_collaboration_response(self, request_type: str, timeout: int = 45) -> Optional[Dict]:
+    def wait_for_collaboration_response(self, request_id: str, timeout: int = 45) -> Optional[Dict]:
         """Wait for response from collaborating agent"""
-        print(f"⏳ Waiting for {request_type} response (timeout: {timeout}s)...")
+        logger.info("⏳ Waiting for response to %s (timeout: %ss)...", request_id, timeout)
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Check for new messages
-                response = requests.get(
-                    f"{self.platform_url}/api/agents/{self.instance_id}/messages",
-                    headers={"X-API-Key": self.api_key},
-                    timeout=5
-                )
-
-                if response.status_code == 200:
-                    messages = response.json().get('messages', [])
-
-                    for message in messages:
-                        if message.get('id') not in self.processed_messages:
-                            content = message.get('content', '')
-
-                            # Check for response types
-                            response_types = [
-                                'validation_response:',
-                                'technical_response:',
-                                'image_response:',
-                                'help_response:',
-                                'validation_error:',
-                                'technical_error:',
-                                'image_error:',
-                                'help_error:'
-                            ]
-
-                            for response_type in response_types:
-                                if content.startswith(response_type):
-                                    self.processed_messages.add(message.get('id'))
-
-                                    try:
-                                        response_data = json.loads(content[len(response_type):])
-                                        from_agent = message.get('from') or message.get('from_instance_id')
-                                        print(f"📨 Received {response_type[:-1]} response from agent {from_agent}")
-                                        return response_data
-                                    except json.JSONDecodeError as e:
-                                        print(f"⚠️ Invalid response format from collaborating agent: {e}")
-                                        print(f"Raw content: {content[:200]}...")
-                                        return None
-
-                time.sleep(2)  # Check every 2 seconds
+        with self._pending_lock:
+            waiter = self._pending_collaborations.get(request_id)
 
-            except Exception as e:
-                print(f"⚠️ Error waiting for response: {e}")
-                time.sleep(2)
+        if waiter is None:
+            return None
+
+        # The message processing loop sets the event when the response arrives
+        received = waiter["event"].wait(timeout)
+
+        with self._pending_lock:
+            self._pending_collaborations.pop(request_id, None)
+
+        if not received:
+            logger.warning("⏰ Collaboration response timeout after %ss", timeout)
+            return None
+
+        return waiter["result"]
+
+    def resolve_collaboration_response(self, response_type: str, payload: str, message: Dict):
+        """Hand a collaboration response to the request waiting on it"""
+        try:
+            response_data = loads_json(payload)
+        except json.JSONDecodeError as e:
+            logger.warning("⚠️ Invalid response format from collaborating agent: %s", e)
+            logger.debug("Raw content: %s...", payload[:200])
+            return
+
+        with self._pending_lock:
+            waiter = self._pending_collaborations.get(response_data.get('request_id'))
+
+        if waiter is None:
+            logger.warning("⚠️ Ignoring %s for unknown request %s", response_type, response_data.get('request_id'))
+            return
 
-        print(f"⏰ Collaboration response timeout after {timeout}s")
-        return None
+        from_agent = message.get('from') or message.get('from_instance_id')
+        logger.info("📨 Received %s response from agent %s", response_type, from_agent)
+
+        waiter["result"] = response_data
+        waiter["event"].set()
 
     def synthesize_collaborative_result(self, user_request: str, initial_ideas: List[Dict],
                                        collaboration_result: Dict, collaboration_decision: Dict,
                                        total_time: float) -> Dict:
         """Synthesize results from collaboration into final response"""
         try:
-            print("🔄 Synthesizing collaborative results...")
+            logger.info("🔄 Synthesizing collaborative results...")
 
             # Extract collaboration data
             help_type = collaboration_decision.get('help_type')
@@ -637,7 +852,7 @@ Generate {num_ideas} ideas:"""
             }
 
         except Exception as e:
-            print(f"❌ Error synthesizing collaborative result: {e}")
+            logger.error("❌ Error synthesizing collaborative result: %s", e)
             return self.create_independent_result(user_request, initial_ideas, collaboration_decision, total_time)
 
     def create_independent_result(self, user_request: str, initial_ideas: List[Dict],
@@ -662,32 +877,33 @@ Generate {num_ideas} ideas:"""
         sections = response.split('\n\n')
 
         for section in sections:
-            if len(section.strip()) < 30:
+            description = section.strip()
+            if len(description) < 30:
                 continue
 
-            lines = section.strip().split('\n')
+            lines = description.split('\n')
             title = ""
-            description = section.strip()
             category = "general"
             feasibility = 5
 
             # Extract title
             for line in lines:
-                if any(keyword in line.lower() for keyword in ['title:', 'idea:', '**', 'solution:']):
-                    title = re.sub(r'^[\d\.\-\*\s]*', '', line).strip()
-                    title = re.sub(r'[\*\:\-]', '', title).strip()
+                line_lower = line.lower()
+                if any(marker in line_lower for marker in TITLE_MARKERS):
+                    title = LIST_PREFIX_RE.sub('', line).strip()
+                    title = TITLE_MARKUP_RE.sub('', title).strip()
                     break
 
             if not title:
                 first_line = lines[0].strip()
-                title = re.sub(r'^[\d\.\-\*\s]*', '', first_line)[:50]
+                title = LIST_PREFIX_RE.sub('', first_line)[:50]
 
             # Extract other fields if present
-            category_match = re.search(r'category:?\s*([a-zA-Z\-]+)', section, re.IGNORECASE)
+            category_match = CATEGORY_RE.search(section)
             if category_match:
                 category = category_match.group(1).lower()
 
-            feasibility_match = re.search(r'feasibility:?\s*(\d+)', section, re.IGNORECASE)
+            feasibility_match = FEASIBILITY_RE.search(section)
             if feasibility_match:
                 feasibility = int(feasibility_match.group(1))
 
@@ -699,12 +915,15 @@ Generate {num_ideas} ideas:"""
                     "feasibility": feasibility
                 })
 
-        return ideas[:8]  # Limit to 8 ideas
+                if len(ideas) == MAX_PARSED_IDEAS:
+                    break  # Limit to 8 ideas
 
-    def call_ollama(self, prompt: str) -> str:
+        return ideas
+
+    def call_ollama(self, prompt: str, num_predict: int = 500) -> str:
         """Call Ollama API for AI generation"""
         try:
-            response = requests.post(
+            response = self._http.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -713,107 +932,356 @@ Generate {num_ideas} ideas:"""
                     "options": {
                         "temperature": 0.7,
                         "top_p": 0.9,
-                        "num_predict": 500  # Limit response length
+                        "num_predict": num_predict  # Limit response length
                     }
                 },
                 timeout=60  # Increase timeout
             )
 
             if response.status_code == 200:
-                return response.json().get('response', 'No response generated')
+                return loads_json(response.content).get('response', 'No response generated')
             else:
                 return f"Error: Ollama API returned {response.status_code}"
 
         except Exception as e:
             return f"Error calling Ollama: {str(e)}"
 
-    def _agent_discovery_loop(self):
-        """Continuously discover available agents on the platform"""
-        while self.running:
-            try:
-                response = requests.get(f"{self.platform_url}/api/instances", timeout=5)
-                if response.status_code == 200:
-                    instances = response.json().get('instances', [])
+    def call_ollama_streaming(self, prompt: str, stop_predicate: Callable[[str], bool]) -> str:
+        """
+        Call Ollama with a streamed response, closing the connection as soon as
+        stop_predicate(accumulated_text) is satisfied
+        """
+        try:
+            response = self._http.post(
+                f"{self.ollama_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": True,
+                    "options": {
+                        "temperature": 0.7,
+                        "top_p": 0.9,
+                        "num_predict": 500  # Limit response length
+                    }
+                },
+                stream=True,
+                timeout=60
+            )
 
-                    # Update available agents
-                    new_agents = {}
-                    for instance in instances:
-                        if instance.get('status') == 'running' and instance.get('id') != self.instance_id:
-                            new_agents[instance.get('id')] = instance
+            with response:
+                if response.status_code != 200:
+                    return f"Error: Ollama API returned {response.status_code}"
 
-                    # Check for new agents
-                    for agent_id, agent_info in new_agents.items():
-                        if agent_id not in self.available_agents:
-                            print(f"🤖 Discovered new agent: {agent_info.get('instance_name')}")
+                chunks = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
 
-                    self.available_agents = new_agents
+                    chunk = loads_json(line)
+                    chunks.append(chunk.get('response', ''))
 
-            except Exception as e:
-                pass  # Silent failure for discovery
+                    if chunk.get('done'):
+                        break
+
+                    if stop_predicate(''.join(chunks)):
+                        break
+
+            return ''.join(chunks) or 'No response generated'
 
-            time.sleep(self.agent_discovery_interval)
+        except Exception as e:
+            return f"Error calling Ollama: {str(e)}"
+
+    @staticmethod
+    def _has_collaboration_decision(text: str) -> bool:
+        """True once DECISION, CONFIDENCE and a complete REASONING line have been generated"""
+        return bool(
+            DECISION_RE.search(text)
+            and CONFIDENCE_RE.search(text)
+            and REASONING_LINE_RE.search(text)
+        )
+
+    def _cached_get(self, url: str, timeout: int = 5) -> Tuple[Optional[Dict], bool]:
+        """
+        GET a JSON endpoint, revalidating the last response with its ETag and
+        falling back to a body hash when the server sends no ETag.
+        Returns (body, changed); body is None if the request failed.
+        """
+        cached = self._http_cache.get(url)
+
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+
+        response = self._http.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            return cached["body"], False
+
+        if response.status_code != 200:
+            return None, False
+
+        body_hash = hashlib.blake2b(response.content, digest_size=8).digest()
+        if cached and cached["body_hash"] == body_hash:
+            cached["etag"] = response.headers.get("ETag")
+            return cached["body"], False
+
+        body = loads_json(response.content)
+        self._http_cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "body_hash": body_hash,
+            "body": body
+        }
+        return body, True
+
+    def _scheduler_loop(self):
+        """Run the periodic background tasks (discovery, health pings) from one thread"""
+        # Heap of (next_run, sequence, interval, task); sequence breaks ties
+        schedule = [
+            (time.monotonic(), 0, self.agent_discovery_interval, self._discover_agents),
+            (time.monotonic(), 1, self.health_interval, self._send_health_ping)
+        ]
+        heapq.heapify(schedule)
+        failures = [0] * len(schedule)  # Consecutive failures, indexed by sequence
+
+        # Bound once; the loop body only touches locals
+        monotonic = time.monotonic
+        wait_for_stop = self._stop_event.wait
+        max_backoff = self.max_backoff_interval
 
-    def _health_monitoring_loop(self):
-        """Send periodic health pings"""
         while self.running:
-            try:
-                requests.post(
-                    f"{self.platform_url}/api/webhook/ping",
-                    headers={"X-API-Key": self.api_key},
-                    json={"status": "running"},
-                    timeout=5
-                )
-            except:
-                pass  # Silent failure for health pings
+            next_run, sequence, interval, task = schedule[0]
+            delay = next_run - monotonic()
+            if delay > 0:
+                if wait_for_stop(delay):
+                    break
+                continue
+
+            heapq.heappop(schedule)
+            if task():
+                failures[sequence] = 0
+                # Fixed rate: schedule from the planned start so task time doesn't
+                # accumulate as drift, but don't burst to catch up after a stall
+                next_run = max(next_run + interval, monotonic())
+            else:
+                # Back off exponentially with jitter while the platform is unreachable
+                failures[sequence] += 1
+                delay = min(interval * 2 ** failures[sequence], max_backoff)
+                next_run = monotonic() + delay + random.uniform(0, 1)
+
+            heapq.heappush(schedule, (next_run, sequence, interval, task))
+
+    def _discover_agents(self) -> bool:
+        """Refresh the available agents on the platform; returns whether the platform answered"""
+        try:
+            body, changed = self._cached_get(f"{self.platform_url}/api/instances", timeout=5)
+            if body is None:
+                return False
+
+            if changed:
+                instances = body.get('instances', ())
+
+                # Update available agents
+                new_agents = {}
+                for instance in instances:
+                    if instance.get('status') == 'running' and instance.get('id') != self.instance_id:
+                        new_agents[instance.get('id')] = instance
+
+                # Check for new agents
+                for agent_id, agent_info in new_agents.items():
+                    if agent_id not in self.available_agents:
+                        logger.info("🤖 Discovered new agent: %s", agent_info.get('instance_name'))
 
-            time.sleep(self.health_interval)
+                self._agents_by_type = self._index_agents_by_type(new_agents)
+                self.available_agents = new_agents
+
+            return True
+
+        except Exception as e:
+            return False  # Silent failure for discovery
+
+    def _send_health_ping(self) -> bool:
+        """Send a health ping to the platform; returns whether it was accepted"""
+        try:
+            response = self._http.post(
+                f"{self.platform_url}/api/webhook/ping",
+                headers=self._auth_headers,
+                json={"status": "running"},
+                timeout=5
+            )
+            return response.status_code < 500
+        except:
+            return False  # Silent failure for health pings
 
     def _message_processing_loop(self):
         """Process incoming messages from other agents or platform"""
         while self.running:
-            try:
-                response = requests.get(
-                    f"{self.platform_url}/api/agents/{self.instance_id}/messages",
-                    headers={"X-API-Key": self.api_key},
-                    timeout=5
-                )
+            if self.message_stream_supported:
+                try:
+                    self._stream_messages()
+                    continue  # Stream closed cleanly, reconnect
+                except:
+                    pass  # Retry the stream after the poll interval
+            else:
+                # The ?since= long-poll is its own catch-up
+                started = time.monotonic()
+                if self._poll_messages(wait=self.message_long_poll_wait):
+                    self._idle_polls = 0
+                    continue
+                if time.monotonic() - started >= self.message_long_poll_wait / 2:
+                    continue  # The platform held the poll open, so no need to sleep
+
+            self._poll_sleep()
+
+    def _poll_sleep(self):
+        """Sleep before the next poll, doubling the interval for each idle or failed poll"""
+        interval = self.message_poll_min_interval * (2 ** self._idle_polls)
+        if interval < self.message_poll_max_interval:
+            self._idle_polls += 1
+        else:
+            interval = self.message_poll_max_interval
+
+        # Jitter keeps many agents from reconnecting in lockstep after an outage
+        self._stop_event.wait(interval * random.uniform(1.0, 1.2))
+
+    def _poll_messages(self, wait: int = 0) -> int:
+        """
+        Fetch the message list once and handle any new messages; returns how many were new.
+        With wait, the platform holds an empty response open until a message arrives.
+        """
+        handled = 0
+        params = {}
+        if self._last_message_id:
+            params["since"] = self._last_message_id
+        if wait:
+            params["wait"] = wait
+
+        headers = self._auth_headers
+        if self._messages_etag:
+            headers = {**headers, "If-None-Match": self._messages_etag}
+
+        try:
+            response = self._http.get(
+                f"{self.platform_url}/api/agents/{self.instance_id}/messages",
+                headers=headers,
+                params=params,
+                timeout=5 + wait
+            )
+
+            if response.status_code == 200:
+                self._messages_etag = response.headers.get("ETag")
+                messages = loads_json(response.content).get('messages', ())
+                for message in messages:
+                    if self._process_message(message):
+                        handled += 1
+
+        except:
+            pass  # Silent failure for message processing
+
+        return handled
+
+    def _stream_messages(self):
+        """Receive messages pushed over the platform's Server-Sent Events stream"""
+        response = self._http.get(
+            f"{self.platform_url}/api/agents/{self.instance_id}/stream",
+            headers=self._auth_headers,
+            stream=True,
+            timeout=(5, 60)  # Platform sends a heartbeat every 25s
+        )
+
+        with response:
+            if response.status_code == 404:
+                logger.info("ℹ️ Platform has no message stream, falling back to polling")
+                self.message_stream_supported = False
+                return
+
+            response.raise_for_status()
+
+            process = self._process_message
+            caught_up = False
+            for line in response.iter_lines(decode_unicode=True):
+                if not self.running:
+                    break
 
-                if response.status_code == 200:
-                    messages = response.json().get('messages', [])
-                    for message in messages:
-                        message_id = message.get('id')
-                        if message_id not in self.processed_messages:
-                            self.handle_incoming_message(message)
-                            self.processed_messages.add(message_id)
+                if not caught_up:
+                    # The platform sends ": connected" once we're subscribed; only then
+                    # poll for anything sent while we weren't, so nothing falls in between
+                    caught_up = True
+                    if self._poll_messages():
+                        self._idle_polls = 0
 
-            except:
-                pass  # Silent failure for message processing
+                if line and line.startswith('data:'):
+                    process(loads_json(line[5:]))
 
-            time.sleep(self.message_check_interval)
+    def _process_message(self, message: Dict) -> bool:
+        """Handle a message unless it has already been seen; returns whether it was new"""
+        message_id = message.get('id')
+        if message_id in self.processed_messages:
+            return False
+
+        self.handle_incoming_message(message)
+        self._mark_processed(message_id)
+        if isinstance(message_id, int) and message_id > self._last_message_id:
+            self._last_message_id = message_id
+        return True
+
+    def _mark_processed(self, message_id: int):
+        """Remember a handled message id, evicting the oldest beyond the cap"""
+        self.processed_messages[message_id] = None
+        if len(self.processed_messages) > self.processed_messages_limit:
+            self.processed_messages.popitem(last=False)
 
     def handle_incoming_message(self, message: Dict):
         """Handle incoming messages from other agents"""
         try:
-            content = message.get('content', '')
+            # Content is "<message_type>:<json payload>"
+            message_type, _, payload = message.get('content', '').partition(':')
+
+            # Responses to our own collaboration requests
+            if message_type in COLLABORATION_RESPONSE_TYPES:
+                self.resolve_collaboration_response(message_type, payload, message)
+                return
 
             # Handle requests from other agents
-            if content.startswith('generate_ideas:'):
-                request_data = json.loads(content[15:])
-                problem = request_data.get('problem', 'No problem specified')
+            handler = self._REQUEST_HANDLERS.get(message_type)
+            if handler:
+                handler(self, payload, message)
 
-                print(f"📨 Received idea generation request from agent {message.get('from_instance_id')}")
+        except Exception as e:
+            logger.error("❌ Error handling incoming message: %s", e)
+
+    def _receive_idea_request(self, payload: str, message: Dict):
+        """Start generating ideas for a generate_ideas request"""
+        request_data = loads_json(payload)
+
+        logger.info("📨 Received idea generation request from agent %s", message.get('from_instance_id'))
+
+        # Run off the message loop, since collaborating waits on that loop for replies
+        future = self._request_pool.submit(self._handle_idea_request, message, request_data)
+        with self._request_futures_lock:
+            self._request_futures.add(future)
+        future.add_done_callback(self._forget_request_future)
+
+    # Request message types from other agents and the methods that handle them
+    _REQUEST_HANDLERS = {
+        "generate_ideas": _receive_idea_request
+    }
 
-                # Generate ideas for the requesting agent
-                result = self.generate_ideas_with_intelligent_collaboration(problem)
+    def _handle_idea_request(self, message: Dict, request_data: Dict):
+        """Generate ideas for another agent and send them back"""
+        try:
+            problem = request_data.get('problem', 'No problem specified')
+
+            # Generate ideas for the requesting agent
+            result = self.generate_ideas_with_intelligent_collaboration(problem)
 
-                # Send response
-                self.send_response_to_agent(message.get('from_instance_id'), request_data.get('request_id'), result)
+            # Send response
+            self.send_response_to_agent(message.get('from_instance_id'), request_data.get('request_id'), result)
 
         except Exception as e:
-            print(f"❌ Error handling incoming message: {e}")
+            logger.error("❌ Error handling idea request: %s", e)
 
     def send_response_to_agent(self, requester_id: int, request_id: str, result: Dict):
-        """Send response back to requesting agent"""
+        """Queue a response back to the requesting agent"""
         try:
             response_data = {
                 "request_id": request_id,
@@ -826,43 +1294,98 @@ Generate {num_ideas} ideas:"""
             message_data = {
                 "to_instance_id": requester_id,
                 "message_type": "response",
-                "content": f"idea_response:{json.dumps(response_data)}",
+                "content": f"idea_response:{dumps_json(response_data)}",
                 "priority": 3,
                 "metadata": {"sender": self.agent_name}
             }
 
-            requests.post(
-                f"{self.platform_url}/api/agents/message",
-                headers={"X-API-Key": self.api_key},
-                json=message_data,
-                timeout=10
-            )
+            self._outbox.put(message_data)
 
         except Exception as e:
-            print(f"❌ Error sending response: {e}")
+            logger.error("❌ Error sending response: %s", e)
+
+    def _response_sender_loop(self):
+        """Post queued responses over the shared keep-alive session"""
+        url = f"{self.platform_url}/api/agents/message"
+        headers = {**self._auth_headers, "Content-Type": "application/json"}
+        while True:
+            message_data = self._outbox.get()
+            if message_data is None:  # Posted by stop()
+                break
+
+            try:
+                # Encode the envelope with the same (orjson when available) encoder as the payload
+                body = dumps_json(message_data).encode()
+                self._http.post(url, headers=headers, data=body, timeout=10)
+            except Exception as e:
+                logger.error("❌ Error sending response: %s", e)
 
     def get_stats(self) -> Dict:
         """Get agent statistics"""
-        total_requests = self.user_requests_handled + self.collaboration_requests_made + self.independent_responses
-        collaboration_rate = (self.collaboration_requests_made / total_requests * 100) if total_requests > 0 else 0
+        handled = self.user_requests_handled
+        collaborations = self.collaboration_requests_made
+        independent = self.independent_responses
+        total_requests = handled + collaborations + independent
+        collaboration_rate = (collaborations * 100.0 / total_requests) if total_requests else 0.0
+
+        # Snapshot once; discovery may swap in a new dict while we read
+        agent_names = [agent.get('instance_name') for agent in self.available_agents.values()]
 
         return {
-            "user_requests_handled": self.user_requests_handled,
-            "collaboration_requests_made": self.collaboration_requests_made,
-            "independent_responses": self.independent_responses,
+            "user_requests_handled": handled,
+            "collaboration_requests_made": collaborations,
+            "independent_responses": independent,
             "collaboration_rate": f"{collaboration_rate:.1f}%",
-            "available_agents": len(self.available_agents),
-            "agent_names": [agent.get('instance_name') for agent in self.available_agents.values()]
+            "available_agents": len(agent_names),
+            "agent_names": agent_names
         }
 
+    def _forget_request_future(self, future: Future):
+        """Done callback dropping a finished request from the in-flight set"""
+        with self._request_futures_lock:
+            self._request_futures.discard(future)
+
     def stop(self):
         """Stop the agent service"""
-        print("🛑 Stopping Realtime IdeaAgent...")
+        logger.info("🛑 Stopping Realtime IdeaAgent...")
         self.running = False
+        self._stop_event.set()
+        # No more replies will be delivered, so release handlers waiting on a collaborator
+        with self._pending_lock:
+            for waiter in self._pending_collaborations.values():
+                waiter["event"].set()
+        # Give in-flight requests a bounded time to finish before the sentinel so their
+        # responses still go out; one stuck in an Ollama call must not hold up Ctrl-C
+        self._request_pool.shutdown(wait=False, cancel_futures=True)
+        with self._request_futures_lock:
+            in_flight = list(self._request_futures)
+        if in_flight:
+            _, still_running = wait_futures(in_flight, timeout=self.stop_drain_timeout)
+            if still_running:
+                logger.warning("⚠️ %s request(s) still running at shutdown; their responses will be dropped",
+                               len(still_running))
+        self._outbox.put(None)
+        self._ollama_pool.shutdown(wait=False)
+        if self._idea_pool is not None:
+            self._idea_pool.shutdown(wait=False)
+        if self.scheduler_thread is not None:
+            self.scheduler_thread.join(timeout=5)  # Returns as soon as any in-flight ping finishes
+        if self.sender_thread is not None:
+            self.sender_thread.join(timeout=5)  # Let queued responses go out
+        self._http.close()
 
 
 def main():
     """Main function - User interface for the standalone agent"""
+    # Worker threads only enqueue log records; a single listener thread writes them out
+    # (QueueHandler formats each record before enqueueing it)
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.handlers.QueueHandler(log_queue)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[log_handler])
+    log_listener.start()
+
     print("🚀 REALTIME IDEAAGENT - Intelligent Collaboration")
     print("=" * 55)
     print("🧠 This agent intelligently decides when to collaborate!")
@@ -935,6 +1458,7 @@ def main():
 
     finally:
         agent.stop()
+        log_listener.stop()
         print("👋 Realtime IdeaAgent stopped")
 
 
@@ -10,54 +10,232 @@ Usage: python standalone_validator_agent.py
 
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
+import queue
+import logging
+import logging.handlers
 import os
 import json
 import re
+import hashlib
+import functools
+import itertools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from typing import Optional, Dict, List
+from typing import ClassVar, Optional, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module works the same, just slower
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# JSON helpers: orjson when installed, stdlib json otherwise
+if orjson is not None:
+    def dumps_json(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    loads_json = orjson.loads
+else:
+    def dumps_json(data) -> str:
+        # Match orjson's compact, unescaped output to keep message content small
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+    loads_json = json.loads
+
+# Precompiled patterns for claim detection
+# Sentences containing percentages, dollar amounts or strong claims
+CLAIM_PATTERNS = [
+    re.compile(r'[^.!?]*\d+%[^.!?]*[.!?]', re.IGNORECASE),
+    re.compile(r'[^.!?]*\$\d+[^.!?]*[.!?]', re.IGNORECASE),
+    re.compile(r'[^.!?]*(research shows|studies indicate|proven|guaranteed)[^.!?]*[.!?]', re.IGNORECASE),
+]
+SENTENCE_RE = re.compile(r'[^.!?]+')
+# Factual claims: percentages, dollar amounts, "<n> million/billion/thousand" and
+# research phrases. One pass; a match like "$5 million" holds two claims, so the
+# optional groups are counted separately (see count_factual_claims).
+FACTUAL_CLAIM_RE = re.compile(
+    r'(\$)?\d+(%| (?:million|billion|thousand))?'
+    r'|(research shows|studies indicate|proven|guaranteed|statistics show)',
+    re.IGNORECASE
+)
+NUMERIC_CLAIM_RE = re.compile(r'\d+%|\$\d+|\d+\s*(million|billion|thousand)')
+
+
+def compile_keywords(keywords: List[str]) -> "re.Pattern":
+    """
+    Compile keywords into one alternation, longest first, wrapped in a lookahead
+    so finditer reports a keyword at every position, including overlapping ones.
+    """
+    alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+# Keyword lists used by the validation heuristics, matched against lowercased text
+HIGH_RISK_PROBLEM_RE = compile_keywords([
+    "investment", "financial", "money", "profit", "trading", "guaranteed",
+    "medical", "health", "treatment", "drug", "safety", "legal", "law"
+])
+MEDIUM_RISK_PROBLEM_RE = compile_keywords([
+    "business", "strategy", "market", "startup", "technical", "system",
+    "implementation", "algorithm", "performance"
+])
+# Risk keywords in idea text, mapped to their level; one pattern scans for both levels
+RISK_TEXT_LEVELS = {
+    **dict.fromkeys([
+        'guaranteed', 'risk-free', '100% safe', 'never fail', 'always profitable',
+        'medical', 'cure', 'treatment', 'investment advice', 'financial guarantee'
+    ], 'high'),
+    **dict.fromkeys([
+        'business strategy', 'market analysis', 'profit', 'revenue', 'technical solution'
+    ], 'medium')
+}
+RISK_TEXT_RE = compile_keywords(list(RISK_TEXT_LEVELS))
+STRONG_CLAIM_RE = compile_keywords(['guaranteed', 'always', 'never', '100%', 'impossible', 'certain'])
+UNREALISTIC_RE = compile_keywords(['guaranteed', 'impossible', '100%', 'never fail', 'always work'])
+REASONABLE_RE = compile_keywords(['might', 'could', 'potentially', 'may', 'likely'])
+
+
+def plausibility_score(feasibility_band: int, long_description: bool, unrealistic: bool, reasonable: bool) -> float:
+    """Plausibility for a feasibility band (0: <=3, 1: middle, 2: >=7) and description traits"""
+    # Basic plausibility factors
+    base_score = 0.6
+
+    # Adjust based on feasibility rating
+    if feasibility_band == 2:
+        base_score += 0.2
+    elif feasibility_band == 0:
+        base_score -= 0.3
+
+    # Adjust based on description quality
+    if long_description:
+        base_score += 0.1
+
+    # Unrealistic claims lower plausibility, reasonable hedging raises it
+    if unrealistic:
+        base_score -= 0.4
+    if reasonable:
+        base_score += 0.1
+
+    return max(0.1, min(0.95, base_score))
+
+
+# Every combination of plausibility inputs, scored once at import
+PLAUSIBILITY_SCORES = {
+    key: plausibility_score(*key)
+    for key in itertools.product((0, 1, 2), (False, True), (False, True), (False, True))
+}
+
+
+@functools.lru_cache(maxsize=256)
+def classify_problem_risk(problem: str) -> Tuple[str, str]:
+    """Map a problem statement to its (risk_level, base approach); cached for repeated problems"""
+    problem_lower = problem.lower()
+
+    if HIGH_RISK_PROBLEM_RE.search(problem_lower):
+        return "HIGH_RISK", "thorough"
+    elif MEDIUM_RISK_PROBLEM_RE.search(problem_lower):
+        return "MEDIUM_RISK", "standard"
+    else:
+        return "LOW_RISK", "quick"
+
 
 class StandaloneValidatorAgent:
     """
     Standalone ValidatorAgent that provides real-time validation services
     """
 
+    CAPABILITIES: ClassVar[Tuple[str, ...]] = (
+        "idea_validation",
+        "simplified_fact_checking",
+        "plausibility_assessment",
+        "risk_analysis",
+        "contextual_validation_strategies"
+    )
+
     def __init__(self, platform_url: str = None):
         self.platform_url = platform_url or os.getenv("EMERGENCE_PLATFORM_URL", "https://emergence-production.up.railway.app")
         self.agent_name = "StandaloneValidatorAgent"
         self.api_key: Optional[str] = None
         self.instance_id: Optional[int] = None
 
+        # Shared keep-alive connection pool for every platform call. The API key is
+        # added to its headers once registration succeeds. Status and read retries
+        # keep urllib3's idempotent-only default so a POSTed response is never
+        # delivered twice; connect failures are retried for every method.
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, connect=2, read=2, backoff_factor=0.2,
+                                                status_forcelist=[429, 502, 503, 504]))
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
+        # Endpoint URLs, built once; the per-instance ones are filled in on registration
+        self._message_url = f"{self.platform_url}/api/agents/message"
+        self._ping_url = f"{self.platform_url}/api/webhook/ping"
+        self._messages_url: Optional[str] = None
+        self._stream_url: Optional[str] = None
+
         # Platform communication
         self.running = False
         self.health_thread: Optional[threading.Thread] = None
         self.message_thread: Optional[threading.Thread] = None
-        self.processed_messages = set()
+        self.sender_thread: Optional[threading.Thread] = None
+        # Outgoing (message_data, counts_as_response) pairs, posted in order by the sender thread
+        self._outbox: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        # Recently seen message ids, oldest first, capped so long runs don't leak memory
+        self.processed_messages: "OrderedDict[int, None]" = OrderedDict()
+        self.processed_messages_limit = 10000
+        # Content hashes of recently handled requests -> (expiry, responses queued for it),
+        # so a copy redelivered under a new message id gets the same answer resent
+        self._recent_requests: "OrderedDict[bytes, Tuple[float, List[tuple]]]" = OrderedDict()
+        self._recent_requests_lock = threading.Lock()
+        self._handling = threading.local()  # request_key of the request this worker is handling
+        self.recent_requests_limit = 2048
+        self.recent_requests_ttl = 60
 
         # Configuration
         self.health_interval = 30
-        self.message_check_interval = 2
+        self.message_check_interval = 2  # Longest wait between polls when idle
+        self.message_poll_min_interval = 0.1  # First wait after a poll that found requests
+        self._idle_polls = 0
+        self.message_stream_supported = True  # Cleared if the platform has no stream endpoint
+        self.message_long_poll_wait = 25  # Seconds the platform may hold an empty poll open
+        self._last_message_id = 0  # Highest message id seen, sent as ?since= when polling
+        self._messages_etag: Optional[str] = None  # Lets unchanged polls come back as 304
 
         # Service statistics
         self.validation_requests_handled = 0
         self.collaboration_responses_sent = 0
         self.total_validations_performed = 0
-        self.start_time = time.time()
+        self._stats_lock = threading.Lock()
+        self.start_time = time.monotonic()
+
+        # Workers for incoming requests, so a slow validation never holds up the message loop
+        self._handler_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="validator-handler")
 
-        print(f"🔍 {self.agent_name} initializing...")
-        print("🎯 Service: Real-time validation for other agents")
-        print("🧠 Intelligence: Contextual validation strategies")
+        # Recent single-idea validation results keyed by a hash of (approach, idea fields)
+        self._validation_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+        self.validation_cache_size = 512
+
+        logger.info("🔍 %s initializing...", self.agent_name)
+        logger.info("🎯 Service: Real-time validation for other agents")
+        logger.info("🧠 Intelligence: Contextual validation strategies")
 
     def start_validator_service(self):
         """Start the validator as a standalone service"""
-        print("🔗 Connecting to Emergence Platform...")
+        logger.info("🔗 Connecting to Emergence Platform...")
 
         if not self.register_with_platform():
-            print("❌ Failed to register with platform")
+            logger.error("❌ Failed to register with platform")
             return False
 
         self.running = True
@@ -69,22 +247,25 @@ class StandaloneValidatorAgent:
         self.message_thread = threading.Thread(target=self._message_processing_loop, daemon=True)
         self.message_thread.start()
 
-        print("✅ Validator service started!")
-        print("🔍 Ready to provide validation services to other agents")
-        print("📡 Listening for validation requests...")
+        self.sender_thread = threading.Thread(target=self._response_sender_loop, daemon=True)
+        self.sender_thread.start()
+
+        logger.info("✅ Validator service started!")
+        logger.info("🔍 Ready to provide validation services to other agents")
+        logger.info("📡 Listening for validation requests...")
         return True
 
     def register_with_platform(self) -> bool:
         """Register with the Emergence platform"""
         try:
-            response = requests.get(f"{self.platform_url}/api/agents", timeout=10)
+            response = self._http.get(f"{self.platform_url}/api/agents", timeout=10)
             if response.status_code != 200:
-                print(f"❌ Failed to get agents: {response.status_code}")
+                logger.error("❌ Failed to get agents: %s", response.status_code)
                 return False
 
-            agents = response.json().get('agents', [])
+            agents = loads_json(response.content).get('agents', [])
             if not agents:
-                print("❌ No agents available for registration")
+                logger.error("❌ No agents available for registration")
                 return False
 
             registration_data = {
@@ -93,24 +274,27 @@ class StandaloneValidatorAgent:
                 "status": "running"
             }
 
-            response = requests.post(
+            response = self._http.post(
                 f"{self.platform_url}/api/webhook/register",
                 json=registration_data,
                 timeout=10
             )
 
             if response.status_code in [200, 201]:
-                result = response.json()
+                result = loads_json(response.content)
                 self.instance_id = result['instance']['id']
                 self.api_key = result['security']['api_key']
-                print(f"✅ Registered as instance {self.instance_id}")
+                self._http.headers["X-API-Key"] = self.api_key
+                self._messages_url = f"{self.platform_url}/api/agents/{self.instance_id}/messages"
+                self._stream_url = f"{self.platform_url}/api/agents/{self.instance_id}/stream"
+                logger.info("✅ Registered as instance %s", self.instance_id)
                 return True
             else:
-                print(f"❌ Registration failed: {response.text}")
+                logger.error("❌ Registration failed: %s", response.text)
                 return False
 
         except Exception as e:
-            print(f"❌ Registration error: {e}")
+            logger.error("❌ Registration error: %s", e)
             return False
 
     def handle_validation_request(self, message: Dict):
@@ -119,19 +303,32 @@ class StandaloneValidatorAgent:
             content = message.get('content', '')
             from_agent = message.get('from_instance_id')
 
-            print(f"📨 Validation request from agent {from_agent}")
+            logger.info("📨 Validation request from agent %s", from_agent)
+
+            request_key = self._request_key(message)
+            cached_responses = self._check_recent_request(request_key)
+            if cached_responses is not None:
+                # The requester may have resent because our reply was lost; an empty list
+                # means the first copy is still being handled and its reply is on the way
+                logger.info("♻️ Duplicate request from agent %s, resending %s cached response(s)",
+                            from_agent, len(cached_responses))
+                for item in cached_responses:
+                    self._outbox.put(item)
+                return
 
-            if content.startswith('validate_ideas:'):
-                self.handle_idea_validation_request(message)
-            elif content.startswith('fact_check:'):
-                self.handle_fact_check_request(message)
-            elif content.startswith('help_request:'):
-                self.handle_general_help_request(message)
+            # Content is "<request_type>:<json payload>"
+            handler = self._REQUEST_HANDLERS.get(content.partition(':')[0])
+            if handler:
+                self._handling.request_key = request_key
+                try:
+                    handler(self, message)
+                finally:
+                    self._handling.request_key = None
             else:
-                print(f"⚠️ Unknown request type: {content[:50]}...")
+                logger.warning("⚠️ Unknown request type: %s...", content[:50])
 
         except Exception as e:
-            print(f"❌ Error handling validation request: {e}")
+            logger.error("❌ Error handling validation request: %s", e)
 
     def handle_idea_validation_request(self, message: Dict):
         """Handle idea validation requests from IdeaAgent"""
@@ -148,27 +345,27 @@ class StandaloneValidatorAgent:
             # Extract instance_id if from_agent is a dictionary
             if isinstance(from_agent_raw, dict):
                 from_agent = from_agent_raw.get('instance_id')
-                print(f"📨 Validation request from agent {from_agent_raw}")
-                print(f"🔍 Extracted instance_id: {from_agent}")
+                logger.info("📨 Validation request from agent %s", from_agent_raw)
+                logger.debug("🔍 Extracted instance_id: %s", from_agent)
             else:
                 from_agent = from_agent_raw
-                print(f"📨 Validation request from agent {from_agent}")
+                logger.info("📨 Validation request from agent %s", from_agent)
 
             if not from_agent:
-                print("⚠️ No requester ID found in message")
-                print(f"Message keys: {list(message.keys())}")
-                print(f"From field: {message.get('from')}")
-                print(f"From field type: {type(message.get('from'))}")
-                print(f"Metadata: {message.get('metadata', {})}")
+                logger.warning("⚠️ No requester ID found in message")
+                logger.debug("Message keys: %s", list(message.keys()))
+                logger.debug("From field: %s", message.get('from'))
+                logger.debug("From field type: %s", type(message.get('from')))
+                logger.debug("Metadata: %s", message.get('metadata', {}))
                 return
 
-            request_data = json.loads(content[15:])  # Remove 'validate_ideas:' prefix
+            request_data = loads_json(content[15:])  # Remove 'validate_ideas:' prefix
 
             ideas = request_data.get('ideas', [])
             problem = request_data.get('problem', '')
             request_id = request_data.get('request_id', '')
 
-            print(f"🔍 Validating {len(ideas)} ideas for problem: {problem[:80]}...")
+            logger.info("🔍 Validating %s ideas for problem: %s...", len(ideas), problem[:80])
 
             # Perform intelligent validation
             validation_result = self.validate_ideas_intelligently(ideas, problem)
@@ -181,10 +378,11 @@ class StandaloneValidatorAgent:
                 "validation_response"
             )
 
-            self.validation_requests_handled += 1
+            with self._stats_lock:
+                self.validation_requests_handled += 1
 
         except Exception as e:
-            print(f"❌ Error handling idea validation: {e}")
+            logger.error("❌ Error handling idea validation: %s", e)
             self.send_error_response(
                 message.get('from_instance_id'),
                 request_data.get('request_id', ''),
@@ -205,16 +403,16 @@ class StandaloneValidatorAgent:
                 from_agent = from_agent_raw
 
             if not from_agent:
-                print("⚠️ No requester ID found for fact-check request")
+                logger.warning("⚠️ No requester ID found for fact-check request")
                 return
 
-            request_data = json.loads(content[11:])  # Remove 'fact_check:' prefix
+            request_data = loads_json(content[11:])  # Remove 'fact_check:' prefix
 
             claim = request_data.get('claim', '')
             fact_type = request_data.get('fact_type', 'general')
             request_id = request_data.get('request_id', '')
 
-            print(f"📋 Fact-checking claim: {claim[:80]}...")
+            logger.info("📋 Fact-checking claim: %s...", claim[:80])
 
             # Perform simplified fact-checking
             fact_result = self.simple_fact_check(claim, fact_type)
@@ -227,10 +425,11 @@ class StandaloneValidatorAgent:
                 "fact_check_response"
             )
 
-            self.total_validations_performed += 1
+            with self._stats_lock:
+                self.total_validations_performed += 1
 
         except Exception as e:
-            print(f"❌ Error handling fact check: {e}")
+            logger.error("❌ Error handling fact check: %s", e)
             self.send_error_response(
                 message.get('from_instance_id'),
                 request_data.get('request_id', ''),
@@ -251,16 +450,16 @@ class StandaloneValidatorAgent:
                 from_agent = from_agent_raw
 
             if not from_agent:
-                print("⚠️ No requester ID found for help request")
+                logger.warning("⚠️ No requester ID found for help request")
                 return
 
-            request_data = json.loads(content[13:])  # Remove 'help_request:' prefix
+            request_data = loads_json(content[13:])  # Remove 'help_request:' prefix
 
             help_type = request_data.get('help_type', 'general')
             request = request_data.get('request', '')
             request_id = request_data.get('request_id', '')
 
-            print(f"🤝 General help request: {help_type} - {request[:60]}...")
+            logger.info("🤝 General help request: %s - %s...", help_type, request[:60])
 
             # Provide general validation help
             help_result = self.provide_general_validation_help(request, help_type)
@@ -274,7 +473,7 @@ class StandaloneValidatorAgent:
             )
 
         except Exception as e:
-            print(f"❌ Error handling help request: {e}")
+            logger.error("❌ Error handling help request: %s", e)
             self.send_error_response(
                 message.get('from_instance_id'),
                 request_data.get('request_id', ''),
@@ -282,17 +481,61 @@ class StandaloneValidatorAgent:
                 "help_error"
             )
 
+    @staticmethod
+    def _request_key(message: Dict) -> bytes:
+        """Hash of sender and content, identifying a request across redeliveries"""
+        sender = message.get('from') or message.get('from_instance_id')
+        return hashlib.blake2b(
+            f"{sender}\n{message.get('content', '')}".encode(), digest_size=16
+        ).digest()
+
+    def _check_recent_request(self, key: bytes) -> Optional[List[tuple]]:
+        """
+        Responses queued for the same request within the TTL, or None if it is new.
+        New requests are recorded so their responses can be resent to duplicates.
+        """
+        now = time.monotonic()
+
+        with self._recent_requests_lock:
+            entry = self._recent_requests.get(key)
+            if entry is not None and entry[0] > now:
+                return list(entry[1])
+
+            self._recent_requests[key] = (now + self.recent_requests_ttl, [])
+            self._recent_requests.move_to_end(key)
+            if len(self._recent_requests) > self.recent_requests_limit:
+                self._recent_requests.popitem(last=False)
+        return None
+
+    def _queue_response(self, message_data: Dict, counts_as_response: bool):
+        """Hand a response to the sender thread, remembering it for resends to duplicates"""
+        item = (message_data, counts_as_response)
+        request_key = getattr(self._handling, "request_key", None)
+        if request_key is not None:
+            with self._recent_requests_lock:
+                entry = self._recent_requests.get(request_key)
+                if entry is not None:
+                    entry[1].append(item)
+        self._outbox.put(item)
+
+    # Request types from other agents and the methods that handle them
+    _REQUEST_HANDLERS = {
+        "validate_ideas": handle_idea_validation_request,
+        "fact_check": handle_fact_check_request,
+        "help_request": handle_general_help_request
+    }
+
     def validate_ideas_intelligently(self, ideas: List[Dict], problem: str) -> Dict:
         """Perform intelligent validation of ideas based on context"""
-        start_time = time.time()
+        started = time.perf_counter()  # Monotonic, unaffected by wall-clock adjustments
 
         try:
-            print("🧠 Analyzing validation requirements...")
+            logger.info("🧠 Analyzing validation requirements...")
 
             # Analyze the problem context for validation strategy
             validation_strategy = self.determine_validation_strategy(problem, ideas)
 
-            print(f"🎯 Using {validation_strategy['approach']} validation strategy")
+            logger.info("🎯 Using %s validation strategy", validation_strategy['approach'])
 
             # Perform validation based on strategy
             validation_results = []
@@ -304,7 +547,7 @@ class StandaloneValidatorAgent:
             # Synthesize overall results
             overall_result = self.synthesize_validation_results(validation_results, validation_strategy)
 
-            validation_time = time.time() - start_time
+            validation_time = time.perf_counter() - started
 
             result = {
                 "validation_result": overall_result,
@@ -316,43 +559,20 @@ class StandaloneValidatorAgent:
                 "timestamp": time.time()
             }
 
-            print(f"✅ Validation complete: {overall_result.get('overall_confidence', 0):.1%} confidence")
+            logger.info("✅ Validation complete: %.1f%% confidence", overall_result.get('overall_confidence', 0) * 100)
             return result
 
         except Exception as e:
-            print(f"❌ Error in intelligent validation: {e}")
+            logger.error("❌ Error in intelligent validation: %s", e)
             return {
                 "error": f"Validation failed: {str(e)}",
-                "validation_time": time.time() - start_time
+                "validation_time": time.perf_counter() - started
             }
 
     def determine_validation_strategy(self, problem: str, ideas: List[Dict]) -> Dict:
         """Determine the appropriate validation strategy based on context"""
-        problem_lower = problem.lower()
-
         # Determine risk level
-        high_risk_indicators = [
-            "investment", "financial", "money", "profit", "trading", "guaranteed",
-            "medical", "health", "treatment", "drug", "safety", "legal", "law"
-        ]
-
-        medium_risk_indicators = [
-            "business", "strategy", "market", "startup", "technical", "system",
-            "implementation", "algorithm", "performance"
-        ]
-
-        high_risk_count = sum(1 for indicator in high_risk_indicators if indicator in problem_lower)
-        medium_risk_count = sum(1 for indicator in medium_risk_indicators if indicator in problem_lower)
-
-        if high_risk_count > 0:
-            risk_level = "HIGH_RISK"
-            approach = "thorough"
-        elif medium_risk_count > 0:
-            risk_level = "MEDIUM_RISK"
-            approach = "standard"
-        else:
-            risk_level = "LOW_RISK"
-            approach = "quick"
+        risk_level, approach = classify_problem_risk(problem)
 
         # Count factual claims in ideas
         total_factual_claims = 0
@@ -377,16 +597,35 @@ class StandaloneValidatorAgent:
     def validate_single_idea(self, idea: Dict, validation_strategy: Dict) -> Dict:
         """Validate a single idea based on the strategy"""
         try:
-            title = idea.get('title', 'Untitled')
-            description = idea.get('description', '')
             approach = validation_strategy['approach']
 
+            # Results depend only on the approach and these idea fields, so repeats are reused
+            cache_key = hashlib.blake2b(dumps_json([
+                approach, idea.get('title', ''), idea.get('description', ''), idea.get('feasibility', 5)
+            ]).encode(), digest_size=16).hexdigest()
+
+            with self._validation_cache_lock:
+                cached_result = self._validation_cache.get(cache_key)
+                if cached_result is not None:
+                    self._validation_cache.move_to_end(cache_key)
+
+            if cached_result is not None:
+                return dict(cached_result)
+
             if approach == "thorough":
-                return self.thorough_validation(idea)
+                result = self.thorough_validation(idea)
             elif approach == "standard":
-                return self.standard_validation(idea)
+                result = self.standard_validation(idea)
             else:  # quick
-                return self.quick_validation(idea)
+                result = self.quick_validation(idea)
+
+            if "error" not in result:
+                with self._validation_cache_lock:
+                    self._validation_cache[cache_key] = result
+                    if len(self._validation_cache) > self.validation_cache_size:
+                        self._validation_cache.popitem(last=False)
+
+            return dict(result)
 
         except Exception as e:
             return {
@@ -406,9 +645,10 @@ class StandaloneValidatorAgent:
             claims = self.extract_validatable_claims(description)
             factual_claims = self.count_factual_claims(description)
 
-            # Assess risk factors
-            risk_score = self.assess_risk_factors(description)
-            plausibility = self.assess_plausibility(idea)
+            # Assess risk factors; both scans share one lowercased copy
+            description_lower = description.lower()
+            risk_score = self.assess_risk_factors(description, description_lower)
+            plausibility = self.assess_plausibility(idea, description_lower)
 
             # Calculate confidence based on multiple factors
             base_confidence = plausibility
@@ -505,19 +745,19 @@ class StandaloneValidatorAgent:
         """Perform simplified fact-checking without external APIs"""
         try:
             # Simplified fact-checking using pattern analysis
+            claim_lower = claim.lower()
             factual_indicators = self.count_factual_claims(claim)
-            risk_score = self.assess_risk_factors(claim)
+            risk_score = self.assess_risk_factors(claim, claim_lower)
 
             # Calculate confidence based on claim characteristics
             base_confidence = 0.6
 
             # Strong claims get lower confidence without verification
-            strong_claim_patterns = ['guaranteed', 'always', 'never', '100%', 'impossible', 'certain']
-            if any(pattern in claim.lower() for pattern in strong_claim_patterns):
+            if STRONG_CLAIM_RE.search(claim_lower):
                 base_confidence *= 0.5
 
             # Numerical claims need verification
-            if re.search(r'\d+%|\$\d+|\d+\s*(million|billion|thousand)', claim):
+            if NUMERIC_CLAIM_RE.search(claim):
                 base_confidence *= 0.6
 
             # High risk topics get lower confidence
@@ -547,89 +787,62 @@ class StandaloneValidatorAgent:
 
     def extract_validatable_claims(self, text: str) -> List[str]:
         """Extract specific claims that can be fact-checked"""
-        claim_patterns = [
-            r'[^.!?]*\d+%[^.!?]*[.!?]',  # Sentences with percentages
-            r'[^.!?]*\$\d+[^.!?]*[.!?]',  # Sentences with dollar amounts
-            r'[^.!?]*(research shows|studies indicate|proven|guaranteed)[^.!?]*[.!?]',  # Strong claims
-        ]
-
         claims = []
-        for pattern in claim_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in CLAIM_PATTERNS:
+            matches = pattern.findall(text)
             claims.extend([match.strip() for match in matches if len(match.strip()) > 20])
 
-        # If no specific claims, extract key sentences
+        # If no specific claims, extract the first few key sentences
         if not claims:
-            sentences = re.split(r'[.!?]+', text)
-            claims = [s.strip() for s in sentences if 30 < len(s.strip()) < 200][:3]
+            for match in SENTENCE_RE.finditer(text):
+                sentence = match.group(0).strip()
+                if 30 < len(sentence) < 200:
+                    claims.append(sentence)
+                    if len(claims) == 3:
+                        break
 
         return claims[:5]  # Limit to 5 claims
 
     def count_factual_claims(self, text: str) -> int:
         """Count factual claims in text"""
-        factual_patterns = [
-            r'\d+%', r'\$\d+', r'\d+ (million|billion|thousand)',
-            r'(research shows|studies indicate|proven|guaranteed|statistics show)'
-        ]
-
         count = 0
-        for pattern in factual_patterns:
-            count += len(re.findall(pattern, text, re.IGNORECASE))
+        for match in FACTUAL_CLAIM_RE.finditer(text):
+            dollar, amount_suffix, phrase = match.groups()
+            count += (dollar is not None) + (amount_suffix is not None) + (phrase is not None)
 
         return count
 
-    def assess_risk_factors(self, text: str) -> float:
-        """Assess risk factors in the text"""
-        high_risk_patterns = [
-            'guaranteed', 'risk-free', '100% safe', 'never fail', 'always profitable',
-            'medical', 'cure', 'treatment', 'investment advice', 'financial guarantee'
-        ]
-
-        medium_risk_patterns = [
-            'business strategy', 'market analysis', 'profit', 'revenue', 'technical solution'
-        ]
+    def assess_risk_factors(self, text: str, text_lower: Optional[str] = None) -> float:
+        """Assess risk factors in the text; pass text_lower if the caller already has it"""
+        if text_lower is None:
+            text_lower = text.lower()
 
-        text_lower = text.lower()
-
-        high_risk_count = sum(1 for pattern in high_risk_patterns if pattern in text_lower)
-        medium_risk_count = sum(1 for pattern in medium_risk_patterns if pattern in text_lower)
+        # One scan finds the distinct risk keywords of both levels
+        found = {match.group(1) for match in RISK_TEXT_RE.finditer(text_lower)}
+        high_risk_count = sum(1 for keyword in found if RISK_TEXT_LEVELS[keyword] == 'high')
+        medium_risk_count = len(found) - high_risk_count
 
         # Calculate risk score (0.0 to 1.0)
         risk_score = min(1.0, (high_risk_count * 0.3 + medium_risk_count * 0.1))
 
         return risk_score
 
-    def assess_plausibility(self, idea: Dict) -> float:
-        """Assess general plausibility of an idea"""
+    def assess_plausibility(self, idea: Dict, description_lower: Optional[str] = None) -> float:
+        """Assess general plausibility of an idea; pass description_lower if already computed"""
         try:
-            title = idea.get('title', '')
             description = idea.get('description', '')
             feasibility = idea.get('feasibility', 5)
+            if description_lower is None:
+                description_lower = description.lower()
 
-            # Basic plausibility factors
-            base_score = 0.6
-
-            # Adjust based on feasibility rating
-            if feasibility >= 7:
-                base_score += 0.2
-            elif feasibility <= 3:
-                base_score -= 0.3
-
-            # Adjust based on description quality
-            if len(description) > 100:
-                base_score += 0.1
+            feasibility_band = 2 if feasibility >= 7 else 0 if feasibility <= 3 else 1
 
-            # Look for unrealistic claims
-            unrealistic_indicators = ['guaranteed', 'impossible', '100%', 'never fail', 'always work']
-            if any(indicator in description.lower() for indicator in unrealistic_indicators):
-                base_score -= 0.4
-
-            # Check for reasonable language
-            reasonable_indicators = ['might', 'could', 'potentially', 'may', 'likely']
-            if any(indicator in description.lower() for indicator in reasonable_indicators):
-                base_score += 0.1
-
-            return max(0.1, min(0.95, base_score))
+            return PLAUSIBILITY_SCORES[(
+                feasibility_band,
+                len(description) > 100,
+                UNREALISTIC_RE.search(description_lower) is not None,
+                REASONABLE_RE.search(description_lower) is not None
+            )]
 
         except Exception:
             return 0.5
@@ -644,13 +857,29 @@ class StandaloneValidatorAgent:
                     "summary": "No ideas provided for validation"
                 }
 
-            # Calculate overall confidence
-            confidences = [result.get('confidence', 0.5) for result in validation_results]
-            overall_confidence = sum(confidences) / len(confidences)
+            # Accumulate confidence, recommendation and distribution counts in one pass
+            total_confidence = 0.0
+            validated_count = review_count = 0
+            high_confidence = moderate_confidence = low_confidence = 0
+
+            for result in validation_results:
+                confidence = result.get('confidence', 0.5)
+                total_confidence += confidence
+
+                recommendation = result.get('recommendation')
+                if recommendation == 'VALIDATED':
+                    validated_count += 1
+                elif recommendation == 'REQUIRES_REVIEW':
+                    review_count += 1
+
+                if confidence >= 0.7:
+                    high_confidence += 1
+                elif confidence >= 0.4:
+                    moderate_confidence += 1
+                else:
+                    low_confidence += 1
 
-            # Count recommendations
-            validated_count = len([r for r in validation_results if r.get('recommendation') == 'VALIDATED'])
-            review_count = len([r for r in validation_results if r.get('recommendation') == 'REQUIRES_REVIEW'])
+            overall_confidence = total_confidence / len(validation_results)
 
             # Determine overall recommendation
             if validated_count >= len(validation_results) * 0.7:
@@ -679,9 +908,9 @@ class StandaloneValidatorAgent:
                 "summary": summary,
                 "ai_synthesis": summary,
                 "confidence_distribution": {
-                    "high_confidence": len([c for c in confidences if c >= 0.7]),
-                    "moderate_confidence": len([c for c in confidences if 0.4 <= c < 0.7]),
-                    "low_confidence": len([c for c in confidences if c < 0.4])
+                    "high_confidence": high_confidence,
+                    "moderate_confidence": moderate_confidence,
+                    "low_confidence": low_confidence
                 }
             }
 
@@ -739,18 +968,19 @@ class StandaloneValidatorAgent:
                 else:
                     clean_result[key] = str(value)  # Convert non-serializable objects to string
 
+            response_timestamp = time.time()
             response_data = {
                 "request_id": request_id,
                 **clean_result,
                 "validator_agent": self.agent_name,
-                "response_timestamp": time.time()
+                "response_timestamp": response_timestamp
             }
 
-            # Ensure the JSON can be serialized
+            # Serialize once, falling back to essential data if the result isn't JSON-serializable
             try:
-                json.dumps(response_data)  # Test serialization
+                content_str = f"{response_type}:{dumps_json(response_data)}"
             except TypeError as e:
-                print(f"⚠️ JSON serialization error: {e}")
+                logger.warning("⚠️ JSON serialization error: %s", e)
                 # Fallback to essential data only
                 response_data = {
                     "request_id": request_id,
@@ -760,16 +990,15 @@ class StandaloneValidatorAgent:
                         "summary": clean_result.get("validation_result", {}).get("summary", "Validation completed")
                     },
                     "validator_agent": self.agent_name,
-                    "response_timestamp": time.time()
+                    "response_timestamp": response_timestamp
                 }
 
-            # Create content string carefully
-            try:
-                content_str = f"{response_type}:{json.dumps(response_data)}"
-            except Exception as json_error:
-                print(f"⚠️ JSON serialization failed: {json_error}")
-                # Ultra-simple fallback
-                content_str = f"{response_type}:{{\"request_id\":\"{request_id}\",\"confidence\":0.5,\"summary\":\"Validation completed\"}}"
+                try:
+                    content_str = f"{response_type}:{dumps_json(response_data)}"
+                except Exception as json_error:
+                    logger.warning("⚠️ JSON serialization failed: %s", json_error)
+                    # Ultra-simple fallback
+                    content_str = f"{response_type}:{{\"request_id\":\"{request_id}\",\"confidence\":0.5,\"summary\":\"Validation completed\"}}"
 
             message_data = {
                 "to_instance_id": requester_id,
@@ -782,32 +1011,15 @@ class StandaloneValidatorAgent:
                 }
             }
 
-            # Final validation that message_data is complete
-            required_fields = ["to_instance_id", "message_type", "content"]
-            missing_fields = [field for field in required_fields if field not in message_data or not message_data[field]]
-            if missing_fields:
-                print(f"❌ Missing required fields: {missing_fields}")
-                return
+            # message_data is complete by construction; checked only in debug runs
+            assert message_data["to_instance_id"] and message_data["message_type"] and message_data["content"], \
+                "send_validation_response: empty required field"
 
-            response = requests.post(
-                f"{self.platform_url}/api/agents/message",
-                headers={"X-API-Key": self.api_key},
-                json=message_data,
-                timeout=10
-            )
-
-            if response.status_code in [200, 201]:
-                print(f"✅ Sent {response_type} to agent {requester_id}")
-                self.collaboration_responses_sent += 1
-            else:
-                print(f"❌ Failed to send response: {response.status_code}")
-                print(f"Response text: {response.text[:200]}...")
-                print(f"Request data size: {len(json.dumps(message_data))} bytes")
+            self._queue_response(message_data, True)
 
         except Exception as e:
-            print(f"❌ Error sending validation response: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ Error sending validation response: %s", e)
+            logger.debug("Traceback for failed validation response", exc_info=True)
 
     def send_error_response(self, requester_id: int, request_id: str, error_message: str, error_type: str):
         """Send error response back to requesting agent"""
@@ -822,7 +1034,7 @@ class StandaloneValidatorAgent:
             message_data = {
                 "to_instance_id": requester_id,
                 "message_type": "response",
-                "content": f"{error_type}:{json.dumps(error_data)}",
+                "content": f"{error_type}:{dumps_json(error_data)}",
                 "priority": 3,
                 "metadata": {
                     "sender": self.agent_name,
@@ -830,27 +1042,47 @@ class StandaloneValidatorAgent:
                 }
             }
 
-            requests.post(
-                f"{self.platform_url}/api/agents/message",
-                headers={"X-API-Key": self.api_key},
-                json=message_data,
-                timeout=10
-            )
-
-            print(f"✅ Sent {error_type} to agent {requester_id}")
+            self._queue_response(message_data, False)
 
         except Exception as e:
-            print(f"❌ Error sending error response: {e}")
+            logger.error("❌ Error sending error response: %s", e)
+
+    def _response_sender_loop(self):
+        """Post queued responses in order over the shared keep-alive session"""
+        url = self._message_url
+        headers = {"Content-Type": "application/json"}  # Merged with the session's API key
+        while True:
+            item = self._outbox.get()
+            if item is None:  # Posted by stop()
+                break
+
+            message_data, counts_as_response = item
+            response_type = message_data["metadata"]["response_type"]
+            try:
+                # Encode the envelope with the same (orjson when available) encoder as the payload
+                body = dumps_json(message_data).encode()
+                response = self._http.post(url, headers=headers, data=body, timeout=(2, 10))
+
+                if response.status_code in [200, 201]:
+                    logger.info("✅ Sent %s to agent %s", response_type, message_data['to_instance_id'])
+                    if counts_as_response:
+                        self.collaboration_responses_sent += 1
+                else:
+                    logger.error("❌ Failed to send response: %s", response.status_code)
+                    logger.debug("Response text: %s...", response.text[:200])
+                    logger.debug("Request data size: %s bytes", len(body))
+
+            except Exception as e:
+                logger.error("❌ Error sending %s: %s", response_type, e)
 
     def _health_monitoring_loop(self):
         """Send periodic health pings"""
         while self.running:
             try:
-                requests.post(
-                    f"{self.platform_url}/api/webhook/ping",
-                    headers={"X-API-Key": self.api_key},
+                self._http.post(
+                    self._ping_url,
                     json={"status": "running"},
-                    timeout=5
+                    timeout=(2, 5)
                 )
             except:
                 pass  # Silent failure for health pings
@@ -859,55 +1091,153 @@ class StandaloneValidatorAgent:
 
     def _message_processing_loop(self):
         """Process incoming validation requests from other agents"""
-        print("📡 Message processing loop started")
+        logger.info("📡 Message processing loop started")
 
         while self.running:
-            try:
-                response = requests.get(
-                    f"{self.platform_url}/api/agents/{self.instance_id}/messages",
-                    headers={"X-API-Key": self.api_key},
-                    timeout=5
-                )
+            if self.message_stream_supported:
+                try:
+                    self._stream_messages()
+                    continue  # Stream closed cleanly, reconnect
+                except:
+                    pass  # Retry the stream after the poll interval
+            else:
+                # The ?since= long-poll is its own catch-up
+                started = time.monotonic()
+                if self._poll_messages(wait=self.message_long_poll_wait):
+                    self._idle_polls = 0
+                    continue
+                if time.monotonic() - started >= self.message_long_poll_wait / 2:
+                    continue  # The platform held the poll open, so no need to sleep
+
+            self._poll_sleep()
+
+    def _poll_sleep(self):
+        """Sleep before the next poll: briefly right after activity, backing off to the check interval"""
+        interval = self.message_poll_min_interval * (2 ** self._idle_polls)
+        if interval < self.message_check_interval:
+            self._idle_polls += 1
+        else:
+            interval = self.message_check_interval
 
-                if response.status_code == 200:
-                    messages = response.json().get('messages', [])
-                    for message in messages:
-                        message_id = message.get('id')
-                        if message_id not in self.processed_messages:
-                            self.handle_validation_request(message)
-                            self.processed_messages.add(message_id)
+        time.sleep(interval)
 
-            except Exception as e:
-                pass  # Silent failure for message processing
+    def _poll_messages(self, wait: int = 0) -> int:
+        """
+        Fetch the message list once and handle any new messages; returns how many were new.
+        With wait, the platform holds an empty response open until a message arrives.
+        """
+        handled = 0
+        params = {}
+        if self._last_message_id:
+            params["since"] = self._last_message_id
+        if wait:
+            params["wait"] = wait
 
-            time.sleep(self.message_check_interval)
+        headers = {"If-None-Match": self._messages_etag} if self._messages_etag else None
+
+        try:
+            response = self._http.get(
+                self._messages_url,
+                headers=headers,
+                params=params,
+                timeout=(2, 5 + wait)
+            )
+
+            if response.status_code == 200:
+                self._messages_etag = response.headers.get("ETag")
+                messages = loads_json(response.content).get('messages', [])
+                for message in messages:
+                    if self._process_message(message):
+                        handled += 1
+
+        except Exception as e:
+            pass  # Silent failure for message processing
+
+        return handled
+
+    def _stream_messages(self):
+        """Receive requests pushed over the platform's Server-Sent Events stream"""
+        response = self._http.get(
+            self._stream_url,
+            stream=True,
+            timeout=(2, 60)  # Platform sends a heartbeat every 25s
+        )
+
+        with response:
+            if response.status_code == 404:
+                logger.info("ℹ️ Platform has no message stream, falling back to polling")
+                self.message_stream_supported = False
+                return
+
+            response.raise_for_status()
+
+            caught_up = False
+            for line in response.iter_lines(decode_unicode=True):
+                if not self.running:
+                    break
+
+                if not caught_up:
+                    # The platform sends ": connected" once we're subscribed; only then
+                    # poll for anything sent while we weren't, so nothing falls in between
+                    caught_up = True
+                    if self._poll_messages():
+                        self._idle_polls = 0
+
+                if line and line.startswith('data:'):
+                    self._process_message(loads_json(line[5:]))
+
+    def _process_message(self, message: Dict) -> bool:
+        """Handle a message unless it has already been seen; returns whether it was new"""
+        message_id = message.get('id')
+        if message_id in self.processed_messages:
+            return False
+
+        self._handler_pool.submit(self.handle_validation_request, message)
+        self._mark_processed(message_id)
+        if isinstance(message_id, int) and message_id > self._last_message_id:
+            self._last_message_id = message_id
+        return True
+
+    def _mark_processed(self, message_id: int):
+        """Remember a handled message id, evicting the oldest beyond the cap"""
+        self.processed_messages[message_id] = None
+        if len(self.processed_messages) > self.processed_messages_limit:
+            self.processed_messages.popitem(last=False)
 
     def get_stats(self) -> Dict:
         """Get validator service statistics"""
-        uptime = time.time() - self.start_time
+        uptime = time.monotonic() - self.start_time
         return {
             "validation_requests_handled": self.validation_requests_handled,
             "collaboration_responses_sent": self.collaboration_responses_sent,
             "total_validations_performed": self.total_validations_performed,
             "uptime_minutes": uptime / 60,
             "service_status": "running" if self.running else "stopped",
-            "capabilities": [
-                "idea_validation",
-                "simplified_fact_checking",
-                "plausibility_assessment",
-                "risk_analysis",
-                "contextual_validation_strategies"
-            ]
+            "capabilities": self.CAPABILITIES
         }
 
     def stop(self):
         """Stop the validator service"""
-        print("🛑 Stopping Standalone ValidatorAgent...")
+        logger.info("🛑 Stopping Standalone ValidatorAgent...")
         self.running = False
+        self._handler_pool.shutdown(wait=True)  # In-flight handlers still queue their responses
+        self._outbox.put(None)
+        if self.sender_thread is not None:
+            self.sender_thread.join(timeout=5)  # Let queued responses go out
+        self._http.close()
 
 
 def main():
     """Main function - Service interface for the standalone validator"""
+    # Worker threads only enqueue log records; a single listener thread writes them out
+    # (QueueHandler formats each record before enqueueing it)
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.handlers.QueueHandler(log_queue)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[log_handler])
+    log_listener.start()
+
     print("🔍 STANDALONE VALIDATORAGENT - Validation Service")
     print("=" * 60)
     print("🎯 This agent provides validation services to other agents")
@@ -926,7 +1256,7 @@ def main():
         print(f"\n🔍 Validation service running!")
         print("Commands:")
         print("  • 'stats' - View service statistics")
-        print("  • 'test <claim>' - Test validation on a claim")
+        print("  • 'test <claim>[; <claim>...]' - Test validation on one or more claims")
         print("  • 'quit' - Exit")
 
         while True:
@@ -941,23 +1271,27 @@ def main():
                     for key, value in stats.items():
                         print(f"   {key}: {value}")
                 elif user_input.startswith('test '):
-                    claim = user_input[5:].strip()
-                    if claim:
-                        print(f"🧪 Testing validation on: {claim}")
+                    # Semicolon-separated claims are validated as one batch
+                    claims = [c.strip() for c in user_input[5:].split(';') if c.strip()]
+                    if claims:
+                        print(f"🧪 Testing validation on {len(claims)} claim(s)")
 
-                        test_idea = {
-                            "title": "Test Claim",
-                            "description": claim,
-                            "feasibility": 5
-                        }
+                        test_ideas = [
+                            {"title": f"Test Claim {i}", "description": claim, "feasibility": 5}
+                            for i, claim in enumerate(claims, 1)
+                        ]
 
-                        result = agent.validate_ideas_intelligently([test_idea], claim)
+                        result = agent.validate_ideas_intelligently(test_ideas, " | ".join(claims))
 
                         if 'error' not in result:
                             validation_result = result.get('validation_result', {})
                             print(f"   Confidence: {validation_result.get('overall_confidence', 0):.1%}")
                             print(f"   Recommendation: {validation_result.get('recommendation', 'UNKNOWN')}")
                             print(f"   Summary: {validation_result.get('summary', 'No summary')}")
+                            if len(claims) > 1:
+                                for claim, individual in zip(claims, result.get('individual_results', ())):
+                                    print(f"   • {claim}: {individual.get('confidence', 0):.1%} "
+                                          f"{individual.get('recommendation', 'UNKNOWN')}")
                         else:
                             print(f"❌ {result['error']}")
                     else:
@@ -972,6 +1306,7 @@ def main():
 
     finally:
         agent.stop()
+        log_listener.stop()
         print("👋 Standalone ValidatorAgent stopped")
 
 